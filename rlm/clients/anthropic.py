@@ -31,6 +31,27 @@ _ANTHROPIC_PRICING: dict[str, tuple[float, float]] = {
 _CACHE_WRITE_MULTIPLIER = 1.25
 _CACHE_READ_MULTIPLIER = 0.10
 
+# Fallback pricing for unknown models: most expensive (opus) tier so cost is never under-reported.
+_FALLBACK_PRICING = (15.0, 75.0)
+
+
+def _per_token_rates(pricing: tuple[float, float]) -> tuple[float, float, float, float]:
+    """Convert (input, output) $/M pricing to per-token (input, cache write, cache read, output)."""
+    input_price, output_price = pricing
+    return (
+        input_price / 1_000_000,
+        input_price * _CACHE_WRITE_MULTIPLIER / 1_000_000,
+        input_price * _CACHE_READ_MULTIPLIER / 1_000_000,
+        output_price / 1_000_000,
+    )
+
+
+# Per-token rates derived once at import so cost estimation is a dot product per model.
+_ANTHROPIC_RATES: dict[str, tuple[float, float, float, float]] = {
+    model: _per_token_rates(pricing) for model, pricing in _ANTHROPIC_PRICING.items()
+}
+_FALLBACK_RATES = _per_token_rates(_FALLBACK_PRICING)
+
 
 class AnthropicMessagesClient(Protocol):
     def create(self, *args: Any, **kwargs: Any) -> anthropic.types.Message: ...
@@ -258,23 +279,23 @@ class AnthropicClient(BaseLM):
         expensive tier (opus) for unknown model names so that cost is never
         under-reported.
         """
-        fallback_pricing = (15.0, 75.0)  # opus tier
         costs: dict[str, float] = {}
         for model in self.model_call_counts:
-            input_price, output_price = _ANTHROPIC_PRICING.get(model, fallback_pricing)
-            input_tokens = self.model_input_tokens[model]
-            output_tokens = self.model_output_tokens[model]
+            input_rate, cache_write_rate, cache_read_rate, output_rate = _ANTHROPIC_RATES.get(
+                model, _FALLBACK_RATES
+            )
             cache_write_tokens = self.model_cache_creation_input_tokens[model]
             cache_read_tokens = self.model_cache_read_input_tokens[model]
 
             # Regular input tokens (excluding cached portions)
-            regular_input = max(input_tokens - cache_write_tokens - cache_read_tokens, 0)
+            regular_input = max(
+                self.model_input_tokens[model] - cache_write_tokens - cache_read_tokens, 0
+            )
 
-            cost = (
-                regular_input * input_price / 1_000_000
-                + cache_write_tokens * input_price * _CACHE_WRITE_MULTIPLIER / 1_000_000
-                + cache_read_tokens * input_price * _CACHE_READ_MULTIPLIER / 1_000_000
-                + output_tokens * output_price / 1_000_000
+            costs[model] = (
+                regular_input * input_rate
+                + cache_write_tokens * cache_write_rate
+                + cache_read_tokens * cache_read_rate
+                + self.model_output_tokens[model] * output_rate
             )
-            costs[model] = cost
         return costs
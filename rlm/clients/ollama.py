@@ -4,6 +4,7 @@ For parity with community forks (e.g. ddivito33/rlm_ollama_client), compare
 model list, options (temperature, etc.), and error handling when upgrading.
 """
 
+import asyncio
 import os
 from collections import defaultdict
 from typing import Any
@@ -46,6 +47,9 @@ class OllamaClient(BaseLM):
         if not self.model_name:
             raise ValueError("Model name is required for Ollama client.")
 
+        # Keep-alive connection pool reused by every request from this client.
+        self.session = requests.Session()
+
         # Per-model usage tracking
         self.model_call_counts: dict[str, int] = defaultdict(int)
         self.model_input_tokens: dict[str, int] = defaultdict(int)
@@ -97,7 +101,7 @@ class OllamaClient(BaseLM):
             "stream": False,
         }
 
-        response = requests.post(url, json=payload, timeout=self.timeout or 300)
+        response = self.session.post(url, json=payload, timeout=self.timeout or 300)
         response.raise_for_status()
         return response.json()
 
@@ -127,6 +131,7 @@ class OllamaClient(BaseLM):
                 initial_delay=1.0,
                 max_delay=10.0,
                 backoff_factor=2.0,
+                jitter=True,
                 retryable_exceptions=(
                     ConnectionError,
                     TimeoutError,
@@ -168,9 +173,9 @@ class OllamaClient(BaseLM):
         Returns:
             Response text from the model
         """
-        # For now, use synchronous implementation
-        # Ollama's async support can be added later if needed
-        return self.completion(prompt, model)
+        # The HTTP call and its retry backoff are blocking; run them off the event
+        # loop so concurrent batched calls are not serialized behind one request.
+        return await asyncio.to_thread(self.completion, prompt, model)
 
     def get_usage_summary(self) -> UsageSummary:
         """Get cost summary for all model calls.
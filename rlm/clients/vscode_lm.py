@@ -21,6 +21,7 @@ it relies entirely on the host process bridge.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
 import threading
@@ -139,9 +140,9 @@ class VsCodeLM(BaseLM):
     async def acompletion(
         self, prompt: str | list[dict[str, Any]] | dict[str, Any], model: str | None = None
     ) -> str:
-        # The VS Code bridge is synchronous (stdin/stdout), so async
-        # just delegates to the sync version.
-        return self.completion(prompt, model)
+        # The VS Code bridge is synchronous (stdin/stdout) and a roundtrip can wait
+        # minutes; run it off the event loop so concurrent batched calls keep going.
+        return await asyncio.to_thread(self.completion, prompt, model)
 
     def get_usage_summary(self) -> UsageSummary:
         summaries: dict[str, ModelUsageSummary] = {}
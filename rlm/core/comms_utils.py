@@ -1,14 +1,20 @@
 """
 Communication utilities for RLM socket protocol.
 
-Protocol: 4-byte big-endian length prefix + JSON payload.
+Protocol: 4-byte big-endian length prefix + JSON payload. A connection carries any
+number of request/response frames in sequence, and clients pool idle connections.
 Used for communication between LMHandler and environment subprocesses.
 Socket requests are retried on transient failures (see failure_modes.md).
+Payloads are encoded with orjson when it is installed, falling back to stdlib json.
 """
 
+import importlib
 import json
+import os
 import socket
 import struct
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -17,12 +23,20 @@ from rlm.core.types import RLMChatCompletion
 
 JsonDict = dict[str, Any]
 
+try:
+    _orjson_module = importlib.import_module("orjson")
+except ImportError:
+    _orjson_module = None
+
+# 4-byte big-endian length prefix for every frame.
+_HEADER = struct.Struct(">I")
+
 # =============================================================================
 # Message Dataclasses
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LMRequest:
     """Request message sent to the LM Handler.
 
@@ -86,7 +100,7 @@ class LMRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LMResponse:
     """Response message from the LM Handler.
 
@@ -179,13 +193,46 @@ class LMResponse:
 # =============================================================================
 
 
+def _encode_json(data: JsonDict) -> bytes:
+    """Encode a payload to UTF-8 JSON bytes, preferring orjson.
+
+    orjson is stricter than json (e.g. non-str dict keys); such payloads fall
+    back to the stdlib encoder so the wire format accepts the same inputs.
+    """
+    if _orjson_module is not None:
+        try:
+            return cast(bytes, _orjson_module.dumps(data))
+        except TypeError:
+            pass
+    return json.dumps(data).encode("utf-8")
+
+
+def _decode_json(payload: bytes | bytearray) -> Any:
+    """Decode UTF-8 JSON bytes, preferring orjson."""
+    if _orjson_module is not None:
+        return _orjson_module.loads(payload)
+    return json.loads(payload)
+
+
 def socket_send(sock: socket.socket, data: JsonDict) -> None:
     """Send a length-prefixed JSON message over socket.
 
     Protocol: 4-byte big-endian length prefix + UTF-8 JSON payload.
     """
-    payload = json.dumps(data).encode("utf-8")
-    sock.sendall(struct.pack(">I", len(payload)) + payload)
+    payload = _encode_json(data)
+    header = _HEADER.pack(len(payload))
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(header + payload)
+        return
+
+    # Scatter/gather write: header and payload leave in one syscall without
+    # copying the payload into a concatenated buffer.
+    sent = sock.sendmsg([header, payload])
+    if sent < len(header):
+        sock.sendall(header[sent:])
+        sock.sendall(payload)
+    elif sent < len(header) + len(payload):
+        sock.sendall(memoryview(payload)[sent - len(header) :])
 
 
 def socket_recv(sock: socket.socket) -> JsonDict:
@@ -197,28 +244,176 @@ def socket_recv(sock: socket.socket) -> JsonDict:
     Raises:
         ConnectionError: If connection closes mid-message.
     """
-    raw_len = sock.recv(4)
-    if not raw_len:
+    header = bytearray(_HEADER.size)
+    received = sock.recv_into(header, _HEADER.size)
+    if not received:
         return {}
+    if received < _HEADER.size:
+        _recv_exact_into(sock, memoryview(header)[received:])
 
-    length = struct.unpack(">I", raw_len)[0]
-    payload = b""
-    while len(payload) < length:
-        chunk = sock.recv(length - len(payload))
-        if not chunk:
-            raise ConnectionError("Connection closed before message complete")
-        payload += chunk
+    (length,) = _HEADER.unpack(header)
+    payload = bytearray(length)
+    _recv_exact_into(sock, memoryview(payload))
 
-    decoded = json.loads(payload.decode("utf-8"))
+    decoded = _decode_json(payload)
     if not isinstance(decoded, dict):
         raise ValueError("Socket payload must decode to a JSON object")
     return cast(JsonDict, decoded)
 
 
+def _recv_exact_into(sock: socket.socket, view: memoryview) -> None:
+    """Fill ``view`` from the socket, reading directly into the preallocated buffer.
+
+    Raises:
+        ConnectionError: If the connection closes before the buffer is full.
+    """
+    offset = 0
+    total = len(view)
+    while offset < total:
+        received = sock.recv_into(view[offset:], total - offset)
+        if not received:
+            raise ConnectionError("Connection closed before message complete")
+        offset += received
+
+
+# Idle keep-alive connections retained per handler address.
+_MAX_IDLE_CONNECTIONS = 8
+# Handler addresses with pooled connections; every LMHandler binds a fresh port, so
+# the least recently used address is evicted past this bound.
+_MAX_POOLED_ADDRESSES = 16
+
+
+class _ConnectionPool:
+    """Per-address pool of idle keep-alive connections to LM handlers.
+
+    Each in-flight request owns its socket exclusively; only idle sockets are
+    shared. Addresses are kept in LRU order and capped, and a stopped handler's
+    address is discarded outright. The pool is reset after fork so children never
+    reuse parent sockets.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = _MAX_IDLE_CONNECTIONS,
+        max_addresses: int = _MAX_POOLED_ADDRESSES,
+    ) -> None:
+        self._max_idle = max_idle
+        self._max_addresses = max_addresses
+        self._idle: OrderedDict[tuple[str, int], list[socket.socket]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def acquire(self, address: tuple[str, int]) -> socket.socket | None:
+        """Pop an idle connection to ``address``, or return None if there is none."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: drop inherited sockets without closing the parent's.
+                self._idle = OrderedDict()
+                self._pid = os.getpid()
+                return None
+            idle = self._idle.get(address)
+            return idle.pop() if idle else None
+
+    def release(self, address: tuple[str, int], sock: socket.socket) -> None:
+        """Return a healthy connection to the pool, closing it if the pool is full."""
+        to_close: list[socket.socket] = [sock]
+        with self._lock:
+            if self._pid == os.getpid():
+                idle = self._idle.get(address)
+                if idle is None:
+                    idle = self._idle[address] = []
+                    while len(self._idle) > self._max_addresses:
+                        to_close.extend(self._idle.popitem(last=False)[1])
+                else:
+                    self._idle.move_to_end(address)
+                if len(idle) < self._max_idle:
+                    idle.append(sock)
+                    to_close.remove(sock)
+        for stale in to_close:
+            stale.close()
+
+    def discard(self, address: tuple[str, int]) -> None:
+        """Close and forget every idle connection to ``address``."""
+        with self._lock:
+            idle = self._idle.pop(address, [])
+        for sock in idle:
+            sock.close()
+
+    def clear(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, OrderedDict()
+        for connections in idle.values():
+            for sock in connections:
+                sock.close()
+
+
+_connection_pool = _ConnectionPool()
+
+
+def close_pooled_connections(address: tuple[str, int]) -> None:
+    """Close this process's idle keep-alive connections to ``address``.
+
+    Called when the LM handler at ``address`` stops; its connections are dead from
+    then on and would otherwise hold file descriptors until evicted.
+    """
+    _connection_pool.discard(address)
+
+
+def _connect(address: tuple[str, int], timeout: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.connect(address)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock: socket.socket, data: JsonDict) -> JsonDict:
+    socket_send(sock, data)
+    return socket_recv(sock)
+
+
+def _is_idle_connection_usable(sock: socket.socket) -> bool:
+    """Peek without blocking: an idle connection must have nothing to read.
+
+    EOF means the handler closed it; unsolicited bytes would desync framing.
+    """
+    try:
+        sock.setblocking(False)
+        sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    return False
+
+
+def _exchange_on_idle(sock: socket.socket, data: JsonDict) -> JsonDict | None:
+    """Exchange over a pooled connection; None means the request may be resent.
+
+    Resending is only safe when the handler cannot have answered: the send failed,
+    or the connection closed before any response byte. A failure after that point
+    propagates, since the completion may already have run.
+    """
+    try:
+        socket_send(sock, data)
+    except ConnectionError:
+        return None
+    response = socket_recv(sock)
+    return response or None
+
+
 def socket_request(address: tuple[str, int], data: JsonDict, timeout: int = 300) -> JsonDict:
-    """Send a request and receive a response over a new socket connection.
+    """Send a request and receive a response over a pooled keep-alive connection.
 
-    Opens a new TCP connection, sends the request, waits for response, then closes.
+    Reuses an idle connection to ``address`` when a live one is available, otherwise
+    opens a new TCP connection. The connection goes back to the pool after a complete
+    response. If a reused connection turns out to be closed before the handler sent
+    any response, the request is resent once on a fresh connection.
 
     Args:
         address: (host, port) tuple to connect to.
@@ -228,11 +423,33 @@ def socket_request(address: tuple[str, int], data: JsonDict, timeout: int = 300)
     Returns:
         Response dictionary.
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.settimeout(timeout)
-        sock.connect(address)
-        socket_send(sock, data)
-        return socket_recv(sock)
+    while (sock := _connection_pool.acquire(address)) is not None:
+        if not _is_idle_connection_usable(sock):
+            sock.close()
+            continue
+        try:
+            sock.settimeout(timeout)
+            response = _exchange_on_idle(sock, data)
+        except BaseException:
+            sock.close()
+            raise
+        if response is not None:
+            _connection_pool.release(address, sock)
+            return response
+        sock.close()
+        break
+
+    sock = _connect(address, timeout)
+    try:
+        response = _exchange(sock, data)
+    except BaseException:
+        sock.close()
+        raise
+    if response:
+        _connection_pool.release(address, sock)
+    else:
+        sock.close()
+    return response
 
 
 # =============================================================================
@@ -250,9 +467,11 @@ def send_lm_request(
     try:
         if depth is not None:
             request.depth = depth
+        # Build the payload once; retries resend the same dict.
+        payload = request.to_dict()
 
         def _do_request() -> JsonDict:
-            return socket_request(address, request.to_dict(), timeout)
+            return socket_request(address, payload, timeout)
 
         response_data = retry_with_backoff(
             _do_request,
@@ -260,6 +479,7 @@ def send_lm_request(
             initial_delay=0.5,
             max_delay=10.0,
             backoff_factor=2.0,
+            jitter=True,
         )
         return LMResponse.from_dict(response_data)
     except Exception as e:
@@ -286,10 +506,10 @@ def send_lm_request_batched(
         List of LMResponse objects, one per prompt, in the same order.
     """
     try:
-        request = LMRequest(prompts=prompts, model=model, depth=depth)
+        payload = LMRequest(prompts=prompts, model=model, depth=depth).to_dict()
 
         def _do_request() -> JsonDict:
-            return socket_request(address, request.to_dict(), timeout)
+            return socket_request(address, payload, timeout)
 
         response_data = retry_with_backoff(
             _do_request,
@@ -297,24 +517,31 @@ def send_lm_request_batched(
             initial_delay=0.5,
             max_delay=10.0,
             backoff_factor=2.0,
+            jitter=True,
         )
         response = LMResponse.from_dict(response_data)
 
         if not response.success:
             # Return error responses for all prompts
             error_message = response.error or "Unknown LM handler error"
-            return [LMResponse.error_response(error_message)] * len(prompts)
+            return _error_responses(error_message, len(prompts))
 
         if response.chat_completions is None:
-            return [LMResponse.error_response("No completions returned")] * len(prompts)
+            return _error_responses("No completions returned", len(prompts))
 
         # Convert batched response to list of individual responses
-        return [
-            LMResponse.success_response(chat_completion)
-            for chat_completion in response.chat_completions
-        ]
+        return list(map(LMResponse.success_response, response.chat_completions))
     except Exception as e:
-        return [LMResponse.error_response(f"Request failed: {e}")] * len(prompts)
+        return _error_responses(f"Request failed: {e}", len(prompts))
+
+
+def _error_responses(error: str, count: int) -> list[LMResponse]:
+    """Build one independent error response per prompt.
+
+    LMResponse is a mutable dataclass, so each slot gets its own instance rather
+    than ``count`` references to a shared object.
+    """
+    return [LMResponse.error_response(error) for _ in range(count)]
 
 
 def normalize_model_preferences(raw: Any) -> dict[str, Any] | None:
@@ -1,49 +1,77 @@
 """
 LMHandler - Routes LLM requests from the RLM process and environment subprocesses.
 
-Uses a multi-threaded socket server. Protocol: 4-byte length prefix + JSON payload.
+Uses a multi-threaded socket server. Protocol: 4-byte length prefix + JSON payload,
+with any number of request/response frames per connection.
 """
 
 import asyncio
+import socket
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from socketserver import StreamRequestHandler, ThreadingTCPServer
-from threading import Thread
+from threading import Lock, Thread
 from types import TracebackType
 from typing import Any, cast
 
 from rlm.clients.base_lm import BaseLM
-from rlm.core.comms_utils import LMRequest, LMResponse, socket_recv, socket_send
+from rlm.core.comms_utils import (
+    LMRequest,
+    LMResponse,
+    close_pooled_connections,
+    socket_recv,
+    socket_send,
+)
 from rlm.core.types import RLMChatCompletion, UsageSummary
 
 # Maximum concurrent LM calls for batched requests (prevents provider overload)
 MAX_CONCURRENT_BATCH = 16
 
+# get_client memo entries; keys come from sandbox-supplied model names and preferences,
+# so the cache is LRU-bounded rather than growing until the next register_client().
+CLIENT_CACHE_SIZE = 256
+
+_ClientCacheKey = tuple[str | None, bool, Any]
+
+
+def _freeze_preferences(value: Any) -> Any:
+    """Convert a model-preferences payload into a hashable key.
+
+    Containers are tagged with their kind so a dict, a list of pairs and a tuple never
+    share a key. Dict keys are kept as-is (so 1 and "1" stay distinct) and items go
+    into a frozenset, which needs no ordering between keys. Raises TypeError for
+    values that still cannot be hashed, so callers can skip memoization.
+    """
+    if isinstance(value, dict):
+        items = cast(dict[Any, Any], value).items()
+        return ("d", frozenset((k, _freeze_preferences(v)) for k, v in items))
+    if isinstance(value, list):
+        return ("l", tuple(_freeze_preferences(item) for item in cast(list[Any], value)))
+    if isinstance(value, tuple):
+        return ("t", tuple(_freeze_preferences(item) for item in cast(tuple[Any, ...], value)))
+    hash(value)
+    return value
+
 
 class LMRequestHandler(StreamRequestHandler):
     """Socket handler for LLM completion requests."""
 
+    # Request/response frames are small; send them without waiting on Nagle coalescing.
+    disable_nagle_algorithm = True
+
     def handle(self):
+        # Clients keep connections open and send several frames in sequence;
+        # serve them in order until the peer closes its end.
+        # ThreadingLMServer is always built with its LMHandler; resolve it once per connection.
+        handler = cast(ThreadingLMServer, self.server).lm_handler
         try:
-            request_data = socket_recv(self.connection)
-            request = LMRequest.from_dict(request_data)
-            server_handler = getattr(self.server, "lm_handler", None)
-            if not isinstance(server_handler, LMHandler):
-                response = LMResponse.error_response("LM handler is not configured on server")
-                self._safe_send(response)
-                return
-            handler = server_handler
-
-            if request.is_batched:
-                # Batched request: process multiple prompts concurrently
-                response = self.handle_batched(request, handler)
-            elif request.prompt:
-                # Single request: process one prompt
-                response = self._handle_single(request, handler)
-            else:
-                response = LMResponse.error_response("Missing 'prompt' or 'prompts' in request.")
-
-            self._safe_send(response)
+            while True:
+                request_data = socket_recv(self.connection)
+                if not request_data:
+                    return
+                if not self._safe_send(self._dispatch(request_data, handler)):
+                    return
 
         except (BrokenPipeError, ConnectionError, ConnectionResetError, OSError):
             # Client disconnected - this is expected during parallel execution
@@ -51,10 +79,24 @@ class LMRequestHandler(StreamRequestHandler):
             pass
 
         except Exception as e:
-            # Try to send error response, but don't fail if socket is broken
+            # Framing is lost (e.g. undecodable payload); report and drop the connection.
             response = LMResponse.error_response(str(e))
             self._safe_send(response)
 
+    def _dispatch(self, request_data: dict[str, Any], handler: "LMHandler") -> LMResponse:
+        """Handle one decoded request frame and build its response."""
+        try:
+            request = LMRequest.from_dict(request_data)
+            if request.is_batched:
+                # Batched request: process multiple prompts concurrently
+                return self.handle_batched(request, handler)
+            if request.prompt:
+                # Single request: process one prompt
+                return self._handle_single(request, handler)
+            return LMResponse.error_response("Missing 'prompt' or 'prompts' in request.")
+        except Exception as e:
+            return LMResponse.error_response(str(e))
+
     def _safe_send(self, response: LMResponse) -> bool:
         """Send response, returning False if the socket is broken."""
         try:
@@ -70,13 +112,13 @@ class LMRequestHandler(StreamRequestHandler):
             return LMResponse.error_response("Missing 'prompt' for single request")
 
         client = handler.get_client(request.model, request.depth, request.model_preferences)
-        budget_error = handler.get_budget_error(request.depth, client)
+        budget_error = handler.get_budget_error(request.depth, client, precheck=True)
         if budget_error is not None:
             return LMResponse.error_response(budget_error)
 
-        start_time = time.perf_counter()
+        start_time = time.perf_counter() if handler.collect_timing else 0.0
         content = client.completion(request.prompt)
-        end_time = time.perf_counter()
+        execution_time = time.perf_counter() - start_time if handler.collect_timing else 0.0
 
         budget_error = handler.get_budget_error(request.depth, client)
         if budget_error is not None:
@@ -91,7 +133,7 @@ class LMRequestHandler(StreamRequestHandler):
                 request.prompt,
                 content,
                 usage_summary,
-                end_time - start_time,
+                execution_time,
             )
         )
 
@@ -102,14 +144,14 @@ class LMRequestHandler(StreamRequestHandler):
 
         prompts = request.prompts
         client = handler.get_client(request.model, request.depth, request.model_preferences)
-        budget_error = handler.get_budget_error(request.depth, client)
+        budget_error = handler.get_budget_error(request.depth, client, precheck=True)
         if budget_error is not None:
             return LMResponse.error_response(budget_error)
 
-        start_time = time.perf_counter()
+        start_time = time.perf_counter() if handler.collect_timing else 0.0
 
         async def run_all():
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCH)
+            semaphore = asyncio.Semaphore(handler.max_concurrent)
 
             async def bounded_call(prompt: str | list[dict[str, Any]]) -> str:
                 async with semaphore:
@@ -118,14 +160,18 @@ class LMRequestHandler(StreamRequestHandler):
             tasks = [bounded_call(prompt) for prompt in prompts]
             return await asyncio.gather(*tasks)
 
-        results = asyncio.run(run_all())
-        end_time = time.perf_counter()
+        loop = handler.event_loop
+        if loop is None:
+            results = asyncio.run(run_all())
+        else:
+            results = asyncio.run_coroutine_threadsafe(run_all(), loop).result()
+        elapsed = time.perf_counter() - start_time if handler.collect_timing else 0.0
 
         budget_error = handler.get_budget_error(request.depth, client)
         if budget_error is not None:
             return LMResponse.error_response(budget_error)
 
-        total_time = end_time - start_time
+        per_prompt_time = elapsed / len(prompts)  # approximate per-prompt time
         model_usage = client.get_last_usage()
         root_model = request.model or client.model_name
         usage_summary = UsageSummary(model_usage_summaries={root_model: model_usage})
@@ -136,7 +182,7 @@ class LMRequestHandler(StreamRequestHandler):
                 prompt,
                 content,
                 usage_summary,
-                total_time / len(prompts),  # approximate per-prompt time
+                per_prompt_time,
             )
             for prompt, content in zip(prompts, results, strict=True)
         ]
@@ -148,10 +194,48 @@ class LMRequestHandler(StreamRequestHandler):
 
 
 class ThreadingLMServer(ThreadingTCPServer):
-    """Multi-threaded TCP server for LM requests."""
+    """Multi-threaded TCP server for LM requests.
+
+    Tracks open client connections so stop() can release handler threads that are
+    idling on keep-alive connections.
+    """
 
     daemon_threads = True
     allow_reuse_address = True
+    # Batched fan-in opens many connections at once; the socketserver default of 5
+    # pending connections overflows and pushes clients into connect retries.
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        request_handler_class: type[LMRequestHandler],
+        lm_handler: "LMHandler",
+    ) -> None:
+        self.lm_handler = lm_handler
+        self._connections: set[socket.socket] = set()
+        self._connections_lock = Lock()
+        super().__init__(server_address, request_handler_class)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._connections_lock:
+            self._connections.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: Any) -> None:
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def close_connections(self) -> None:
+        """Shut down every open client connection, unblocking their handler threads."""
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
 
 
 class LMHandler:
@@ -170,15 +254,31 @@ class LMHandler:
         other_backend_client: BaseLM | None = None,
         max_root_tokens: int | None = None,
         max_sub_tokens: int | None = None,
+        max_concurrent: int = MAX_CONCURRENT_BATCH,
+        collect_timing: bool = True,
     ):
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be >= 1, got {max_concurrent}")
         self.default_client = client
         self.other_backend_client = other_backend_client
         self.max_root_tokens = max_root_tokens
         self.max_sub_tokens = max_sub_tokens
+        self.max_concurrent = max_concurrent
+        # When False, socket completions report execution_time=0.0 without timing the call.
+        self.collect_timing = collect_timing
         self.clients: dict[str, BaseLM] = {}
+        self._client_cache: OrderedDict[_ClientCacheKey, BaseLM] = OrderedDict()
+        self._client_cache_lock = Lock()
+        self._clients_lower: list[tuple[str, BaseLM]] = []
+        # Keyed by the client object itself, not id(), so a collected client's id
+        # cannot be inherited by a new one.
+        self._within_budget: set[tuple[BaseLM, bool]] = set()
+        self._budget_lock = Lock()
         self.host = host
         self._server: ThreadingLMServer | None = None
         self._thread: Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: Thread | None = None
         self._port = port
 
         self.register_client(client.model_name, client)
@@ -186,6 +286,9 @@ class LMHandler:
     def register_client(self, model_name: str, client: BaseLM) -> None:
         """Register a client for a specific model name."""
         self.clients[model_name] = client
+        with self._client_cache_lock:
+            self._client_cache.clear()
+        self._clients_lower = [(name.lower(), c) for name, c in self.clients.items()]
 
     def get_client(
         self,
@@ -200,7 +303,35 @@ class LMHandler:
         - If model_preferences are provided, resolve to the first matching registered client.
         - depth=0: use default_client (main backend)
         - depth>=1: use other_backend_client if it exists, otherwise default_client
+
+        Resolutions are memoized per (model, depth bucket, preferences) in an LRU of
+        CLIENT_CACHE_SIZE entries, cleared by the next register_client() call.
         """
+        try:
+            key: _ClientCacheKey = (model, depth >= 1, _freeze_preferences(model_preferences))
+        except TypeError:
+            return self._resolve_client(model, depth, model_preferences)
+
+        # Handler threads share the cache; OrderedDict reordering is not atomic.
+        with self._client_cache_lock:
+            client = self._client_cache.get(key)
+            if client is not None:
+                self._client_cache.move_to_end(key)
+                return client
+
+        client = self._resolve_client(model, depth, model_preferences)
+        with self._client_cache_lock:
+            self._client_cache[key] = client
+            if len(self._client_cache) > CLIENT_CACHE_SIZE:
+                self._client_cache.popitem(last=False)
+        return client
+
+    def _resolve_client(
+        self,
+        model: str | None,
+        depth: int,
+        model_preferences: dict[str, Any] | None,
+    ) -> BaseLM:
         if model and model in self.clients:
             return self.clients[model]
 
@@ -219,44 +350,17 @@ class LMHandler:
 
         This is intentionally permissive and forward-compatible to support future
         MCP Sampling modelPreferences payloads without coupling to a fixed schema.
+        Keys are tried in _PREFERENCE_RESOLVERS order; the first match wins.
         """
         if not model_preferences:
             return None
 
-        direct_match = self._resolve_direct_preference(model_preferences)
-        if direct_match is not None:
-            return direct_match
-
-        candidate_match = self._resolve_candidate_preference(model_preferences)
-        if candidate_match is not None:
-            return candidate_match
-
-        return self._resolve_contains_preference(model_preferences)
-
-    def _resolve_direct_preference(self, model_preferences: dict[str, Any]) -> BaseLM | None:
-        for key in ("model", "model_name", "preferred_model"):
-            model_name = model_preferences.get(key)
-            matched_client = self._client_by_model_name(model_name)
-            if matched_client is not None:
-                return matched_client
-        return None
-
-    def _resolve_candidate_preference(self, model_preferences: dict[str, Any]) -> BaseLM | None:
-        candidates = model_preferences.get("candidates")
-        if not isinstance(candidates, list):
-            return None
-        for candidate in cast(list[Any], candidates):
-            matched_client = self._client_by_model_name(candidate)
-            if matched_client is not None:
-                return matched_client
-        return None
-
-    def _resolve_contains_preference(self, model_preferences: dict[str, Any]) -> BaseLM | None:
-        for key in ("contains", "family"):
-            hint = model_preferences.get(key)
-            matched_client = self._client_by_name_substring(hint)
-            if matched_client is not None:
-                return matched_client
+        for key, resolver in self._PREFERENCE_RESOLVERS:
+            value = model_preferences.get(key)
+            if value is not None:
+                matched_client = resolver(self, value)
+                if matched_client is not None:
+                    return matched_client
         return None
 
     def _client_by_model_name(self, model_name: Any) -> BaseLM | None:
@@ -264,15 +368,33 @@ class LMHandler:
             return None
         return self.clients.get(model_name)
 
+    def _client_by_candidates(self, candidates: Any) -> BaseLM | None:
+        if not isinstance(candidates, list):
+            return None
+        for candidate in cast(list[Any], candidates):
+            if isinstance(candidate, str) and candidate in self.clients:
+                return self.clients[candidate]
+        return None
+
     def _client_by_name_substring(self, hint: Any) -> BaseLM | None:
         if not isinstance(hint, str):
             return None
         hint_lower = hint.lower()
-        for model_name, client in self.clients.items():
-            if hint_lower in model_name.lower():
+        for name_lower, client in self._clients_lower:
+            if hint_lower in name_lower:
                 return client
         return None
 
+    # Exact names first, then candidate lists, then substring hints.
+    _PREFERENCE_RESOLVERS: tuple[tuple[str, Callable[["LMHandler", Any], BaseLM | None]], ...] = (
+        ("model", _client_by_model_name),
+        ("model_name", _client_by_model_name),
+        ("preferred_model", _client_by_model_name),
+        ("candidates", _client_by_candidates),
+        ("contains", _client_by_name_substring),
+        ("family", _client_by_name_substring),
+    )
+
     def resolve_model_name(
         self,
         model: str | None = None,
@@ -299,13 +421,23 @@ class LMHandler:
         """Get (host, port) tuple for connecting."""
         return (self.host, self.port)
 
+    @property
+    def event_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Background event loop used for batched requests; None until started."""
+        return self._loop
+
     def start(self) -> tuple[str, int]:
         """Start the socket server in a background thread. Returns (host, port)."""
         if self._server is not None:
             return self.address
 
-        self._server = ThreadingLMServer((self.host, self._port), LMRequestHandler)
-        self._server.lm_handler = self  # type: ignore
+        # One long-lived loop serves every batched request instead of a fresh
+        # asyncio.run() per request, so async client connection pools are reused.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+        self._server = ThreadingLMServer((self.host, self._port), LMRequestHandler, self)
 
         self._thread = Thread(target=self._server.serve_forever, daemon=True)
         self._thread.start()
@@ -313,11 +445,35 @@ class LMHandler:
         return self.address
 
     def stop(self) -> None:
-        """Stop the socket server."""
+        """Stop the socket server and the batched-request event loop."""
         if self._server:
+            address = self.address
             self._server.shutdown()
+            self._server.server_close()
+            self._server.close_connections()
             self._server = None
+            close_pooled_connections(address)
             self._thread = None
+        if self._loop is not None:
+            self._stop_event_loop(self._loop)
+            self._loop = None
+            self._loop_thread = None
+
+    def _stop_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Cancel in-flight batched work, then stop and close the loop."""
+
+        async def cancel_pending() -> None:
+            current = asyncio.current_task()
+            pending = [task for task in asyncio.all_tasks() if task is not current]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if self._loop_thread is not None:
+            self._loop_thread.join()
+        loop.close()
 
     def completion(
         self,
@@ -328,7 +484,7 @@ class LMHandler:
     ) -> str:
         """Direct completion call (for main process use)."""
         client = self.get_client(model, depth=0, model_preferences=model_preferences)
-        budget_error = self.get_budget_error(0, client)
+        budget_error = self.get_budget_error(0, client, precheck=True)
         if budget_error is not None:
             raise RuntimeError(budget_error)
 
@@ -357,16 +513,31 @@ class LMHandler:
             on_chunk,
         )
 
-    def get_budget_error(self, depth: int, client: BaseLM) -> str | None:
-        """Return token budget error text if a budget is set and exceeded; otherwise None."""
+    def get_budget_error(self, depth: int, client: BaseLM, precheck: bool = False) -> str | None:
+        """Return token budget error text if a budget is set and exceeded; otherwise None.
+
+        With precheck=True (before a call), the token count is skipped when this
+        handler's last check for the same client and bucket found it within budget;
+        every call routed here is followed by a full check, which resets that state.
+        """
         max_tokens = self.max_root_tokens if depth == 0 else self.max_sub_tokens
         if max_tokens is None:
             return None
 
-        total_tokens = client.get_total_tokens()
-        if total_tokens <= max_tokens:
-            return None
+        key = (client, depth == 0)
+        # Handler threads share this memo. Counting and updating under one lock means
+        # a check that finishes later also counted later; totals only grow, so a stale
+        # within-budget result cannot overwrite a newer over-budget one.
+        with self._budget_lock:
+            if precheck and key in self._within_budget:
+                return None
+
+            total_tokens = client.get_total_tokens()
+            if total_tokens <= max_tokens:
+                self._within_budget.add(key)
+                return None
 
+            self._within_budget.discard(key)
         bucket_name = "root" if depth == 0 else "sub"
         return f"Token budget exceeded for {bucket_name} calls: {total_tokens} > {max_tokens}"
 
@@ -385,16 +556,16 @@ class LMHandler:
 
     def get_usage_summary(self) -> UsageSummary:
         """Get the usage summary for all clients, merged into a single dict."""
+        # Default client, other backend, then every registered client. The default
+        # client is also registered, so summarize each client object once, at its
+        # last position, to keep the same precedence for shared model names.
+        candidates = [self.default_client, self.other_backend_client, *self.clients.values()]
+        unique: dict[int, BaseLM] = {}
+        for client in reversed(candidates):
+            if client is not None:
+                unique.setdefault(id(client), client)
+
         merged: dict[str, Any] = {}
-        # Include default client
-        default_summary = self.default_client.get_usage_summary()
-        merged.update(default_summary.model_usage_summaries)
-        # Include other backend client if it exists
-        if self.other_backend_client is not None:
-            other_summary = self.other_backend_client.get_usage_summary()
-            merged.update(other_summary.model_usage_summaries)
-        # Include all registered clients
-        for client in self.clients.values():
-            client_summary = client.get_usage_summary()
-            merged.update(client_summary.model_usage_summaries)
+        for client in reversed(unique.values()):
+            merged.update(client.get_usage_summary().model_usage_summaries)
         return UsageSummary(model_usage_summaries=merged)
@@ -1,5 +1,6 @@
 """Retry mechanism with exponential backoff for transient failures."""
 
+import random
 import time
 from collections.abc import Callable
 from typing import TypeVar
@@ -7,6 +8,23 @@ from typing import TypeVar
 T = TypeVar("T")
 
 
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """Return a server-requested retry delay carried on the exception, if any."""
+    retry_after = getattr(exc, "retry_after", None)
+    if isinstance(retry_after, bool) or not isinstance(retry_after, int | float):
+        return None
+    return float(retry_after) if retry_after >= 0 else None
+
+
+def _backoff_delay(exc: BaseException, delay: float, max_delay: float, jitter: bool) -> float:
+    """Compute the sleep before the next attempt, capped at max_delay."""
+    retry_after = _retry_after_seconds(exc)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    capped = min(delay, max_delay)
+    return random.uniform(0, capped) if jitter else capped
+
+
 def retry_with_backoff(
     func: Callable[[], T],
     max_attempts: int = 3,
@@ -18,6 +36,7 @@ def retry_with_backoff(
         TimeoutError,
         OSError,
     ),
+    jitter: bool = False,
 ) -> T:
     """
     Retry a function with exponential backoff.
@@ -29,6 +48,11 @@ def retry_with_backoff(
         max_delay: Maximum delay in seconds
         backoff_factor: Multiplier for delay after each retry
         retryable_exceptions: Tuple of exception types to retry on
+        jitter: Sleep a uniform random time up to the backoff delay ("full jitter")
+            so concurrent callers do not retry in lockstep
+
+    An exception carrying a numeric ``retry_after`` attribute (seconds) overrides the
+    computed delay, still capped at max_delay.
 
     Returns:
         Result from function call
@@ -45,7 +69,7 @@ def retry_with_backoff(
         except retryable_exceptions as e:
             last_exception = e
             if attempt < max_attempts - 1:
-                time.sleep(min(delay, max_delay))
+                time.sleep(_backoff_delay(e, delay, max_delay, jitter))
                 delay *= backoff_factor
             else:
                 raise
@@ -54,3 +78,4 @@ def retry_with_backoff(
     if last_exception:
         raise last_exception
     raise RuntimeError("Retry failed without exception")
+
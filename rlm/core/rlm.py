@@ -1,10 +1,11 @@
 import asyncio
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import TracebackType
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from rlm.clients import BaseLM, get_client
 from rlm.core.lm_handler import LMHandler
@@ -13,6 +14,7 @@ from rlm.core.types import (
     ClientBackend,
     CodeBlock,
     EnvironmentType,
+    ModelUsageSummary,
     REPLResult,
     RLMChatCompletion,
     RLMIteration,
@@ -22,6 +24,7 @@ from rlm.core.types import (
 from rlm.environments import BaseEnv, SupportsPersistence, get_environment
 from rlm.logger import RLMLogger, VerbosePrinter
 from rlm.utils.parsing import (
+    FenceScanner,
     find_code_blocks,
     find_final_answer,
     format_iteration,
@@ -29,14 +32,77 @@ from rlm.utils.parsing import (
 from rlm.utils.prompts import (
     RLM_SYSTEM_PROMPT,
     QueryMetadata,
-    build_rlm_system_prompt,
+    build_metadata_prompt,
+    build_system_prompt_content,
     build_user_prompt,
 )
 from rlm.utils.rlm_utils import filter_sensitive_keys
-from rlm.utils.token_utils import count_tokens, get_context_limit
+from rlm.utils.token_utils import IncrementalTokenCounter, count_tokens, get_context_limit
+
+# Prefix prompt cache: LRU capacity and 64-bit FNV-style rolling hash constants.
+_PREFIX_CACHE_MAX_ENTRIES = 128
+_FNV64_PRIME = 0x100000001B3
+_HASH64_MASK = 0xFFFFFFFFFFFFFFFF
+
+# Fixed instructions for compaction and the out-of-iterations answer. Keeping them
+# byte-identical across calls lets provider-side prompt caching reuse them.
+_COMPACTION_SUMMARY_PROMPT = (
+    "Summarize your progress so far. Include:\n"
+    "1. Which steps/sub-tasks you have completed and which remain.\n"
+    "2. Any concrete intermediate results (numbers, values, variable names) "
+    "you computed — preserve these exactly.\n"
+    "3. What your next action should be.\n"
+    "Be concise (1–3 paragraphs) but preserve all key results and your "
+    "current position in the task."
+)
+_COMPACTION_CONTINUE_TEMPLATE = (
+    "Your conversation has been compacted {count} time(s). "
+    "Continue from the above summary. Do NOT repeat work you have already "
+    "completed. Use SHOW_VARS() to check which REPL variables exist, "
+    "and check `history` for full context. "
+    "Your next action:"
+)
+_DEFAULT_ANSWER_PROMPT = (
+    "Please provide a final answer to the user's question based on the information provided."
+)
+
 
+def _fold_prefix_hash(prefix_hash: int, messages: Iterable[dict[str, Any]]) -> int:
+    """Extend a rolling hash of a message prefix with further messages.
+
+    Order-sensitive, so equal hashes identify the whole prefix rather than just its
+    last message. str hashes are cached by CPython, so re-folding is cheap.
+    """
+    for message in messages:
+        content = message.get("content")
+        key = (message.get("role"), content if isinstance(content, str) else str(content))
+        prefix_hash = ((prefix_hash ^ hash(key)) * _FNV64_PRIME) & _HASH64_MASK
+    return prefix_hash
+
+
+def _usage_since(before: UsageSummary, after: UsageSummary) -> UsageSummary:
+    """Return the usage a client accrued between two cumulative snapshots."""
+    summaries: dict[str, ModelUsageSummary] = {}
+    for model, total in after.model_usage_summaries.items():
+        prior = before.model_usage_summaries.get(model)
+        if prior is None:
+            summaries[model] = total
+            continue
+        delta = ModelUsageSummary(
+            total_calls=total.total_calls - prior.total_calls,
+            total_input_tokens=total.total_input_tokens - prior.total_input_tokens,
+            total_output_tokens=total.total_output_tokens - prior.total_output_tokens,
+            cache_creation_input_tokens=(
+                total.cache_creation_input_tokens - prior.cache_creation_input_tokens
+            ),
+            cache_read_input_tokens=total.cache_read_input_tokens - prior.cache_read_input_tokens,
+        )
+        if delta.total_calls:
+            summaries[model] = delta
+    return UsageSummary(model_usage_summaries=summaries)
 
-@dataclass
+
+@dataclass(slots=True)
 class RLMConfig:
     backend: ClientBackend = "openai"
     backend_kwargs: dict[str, Any] | None = None
@@ -69,7 +135,21 @@ class RLMConfig:
     custom_tools: dict[str, Any] | None = None
 
 
-@dataclass
+class _EnvCaps(NamedTuple):
+    """Environment capabilities, probed once per completion instead of per iteration."""
+
+    supports_compaction: bool
+    supports_persistence: bool
+
+    @classmethod
+    def probe(cls, environment: BaseEnv) -> "_EnvCaps":
+        return cls(
+            supports_compaction=hasattr(environment, "append_compaction_entry"),
+            supports_persistence=isinstance(environment, SupportsPersistence),
+        )
+
+
+@dataclass(slots=True)
 class _LoopState:
     prompt: str | dict[str, Any]
     root_prompt: str | None
@@ -78,6 +158,14 @@ class _LoopState:
     message_history: list[dict[str, Any]]
     compaction_count: int
     time_start: float
+    # Set when compaction is enabled; tokenizes each history message once.
+    token_counter: IncrementalTokenCounter | None = None
+    # Rolling hash of message_history, maintained when the prefix cache is enabled.
+    prefix_hash: int = 0
+    env_caps: _EnvCaps = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.env_caps = _EnvCaps.probe(self.environment)
 
 
 class RLM:
@@ -133,6 +221,11 @@ class RLM:
     def _apply_config(self, config: RLMConfig) -> None:
         self.backend = config.backend
         self.backend_kwargs = config.backend_kwargs
+        self.root_model: str = (
+            config.backend_kwargs.get("model_name", "unknown")
+            if config.backend_kwargs
+            else "unknown"
+        )
         self.environment_type = config.environment
         self.environment_kwargs = (
             config.environment_kwargs.copy() if config.environment_kwargs is not None else {}
@@ -150,7 +243,13 @@ class RLM:
         self.max_sub_tokens = config.max_sub_tokens
         self.on_root_chunk = config.on_root_chunk
         self.enable_prefix_cache = config.enable_prefix_cache
-        self._prefix_prompt_cache: dict[str, list[dict[str, Any]]] = {}
+        # Instance-scoped, so prefixes survive across completion() calls (persistent mode).
+        self._prefix_prompt_cache: OrderedDict[tuple[int, int], list[dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._prefix_cache_hits = 0
+        self._prefix_cache_misses = 0
+        self._prefix_cache_evictions = 0
         self.depth = config.depth
         self.max_depth = config.max_depth
         self.max_iterations = config.max_iterations
@@ -168,8 +267,13 @@ class RLM:
         self.compaction = config.compaction
         self.compaction_threshold_pct = config.compaction_threshold_pct
         self.custom_tools = config.custom_tools
+        # Query-independent, so built once rather than on every completion().
+        self._system_prompt_content = build_system_prompt_content(
+            self.system_prompt, self.custom_tools, self.compaction
+        )
         self.persistent = config.persistent
         self._persistent_env: SupportsPersistence | None = None
+        self._fallback_client: BaseLM | None = None
         self._cumulative_cost: float = 0.0
         self._last_handler_tokens: int = 0
         self._error_count: int = 0
@@ -179,9 +283,7 @@ class RLM:
         if not (self.logger or self.verbose.enabled):
             return
         metadata = RLMMetadata(
-            root_model=self.backend_kwargs.get("model_name", "unknown")
-            if self.backend_kwargs
-            else "unknown",
+            root_model=self.root_model,
             max_depth=self.max_depth,
             max_iterations=self.max_iterations,
             backend=self.backend,
@@ -205,9 +307,15 @@ class RLM:
 
     def _create_lm_handler(self) -> LMHandler:
         client: BaseLM = get_client(cast(ClientBackend, self.backend), self.backend_kwargs or {})
-        other_backend_client: BaseLM | None = None
+        other_clients: list[BaseLM] = []
         if self.other_backends and self.other_backend_kwargs:
-            other_backend_client = get_client(self.other_backends[0], self.other_backend_kwargs[0])
+            other_clients = [
+                get_client(backend, kwargs)
+                for backend, kwargs in zip(
+                    self.other_backends, self.other_backend_kwargs, strict=True
+                )
+            ]
+        other_backend_client = other_clients[0] if other_clients else None
 
         lm_handler = LMHandler(
             client,
@@ -215,15 +323,8 @@ class RLM:
             max_root_tokens=self.max_root_tokens,
             max_sub_tokens=self.max_sub_tokens,
         )
-        if self.other_backends and self.other_backend_kwargs:
-            paired_backends = zip(
-                self.other_backends,
-                self.other_backend_kwargs,
-                strict=True,
-            )
-            for backend, kwargs in paired_backends:
-                other_client: BaseLM = get_client(backend, kwargs)
-                lm_handler.register_client(other_client.model_name, other_client)
+        for other_client in other_clients:
+            lm_handler.register_client(other_client.model_name, other_client)
         if self.sub_lms is not None:
             for alias, sub_lm in self.sub_lms.items():
                 lm_handler.register_client(alias, sub_lm)
@@ -238,20 +339,18 @@ class RLM:
         env_kwargs["lm_handler_address"] = (lm_handler.host, lm_handler.port)
         env_kwargs["context_payload"] = prompt
         env_kwargs["depth"] = self.depth + 1
+        # Passed by reference: LocalREPL deep-copies this config on receipt, and other
+        # environments only carry it in their kwargs.
         env_kwargs["recursive_rlm_config"] = {
             "backend": self.backend,
-            "backend_kwargs": self.backend_kwargs.copy() if self.backend_kwargs else None,
+            "backend_kwargs": self.backend_kwargs or None,
             "environment": self.environment_type,
-            "environment_kwargs": self.environment_kwargs.copy(),
+            "environment_kwargs": self.environment_kwargs,
             "max_depth": self.max_depth,
             "max_iterations": self.max_iterations,
             "enable_recursive_subcalls": self.enable_recursive_subcalls,
-            "other_backends": self.other_backends.copy() if self.other_backends else None,
-            "other_backend_kwargs": (
-                [kwargs.copy() for kwargs in self.other_backend_kwargs]
-                if self.other_backend_kwargs
-                else None
-            ),
+            "other_backends": self.other_backends or None,
+            "other_backend_kwargs": self.other_backend_kwargs or None,
             "max_root_tokens": self.max_root_tokens,
             "max_sub_tokens": self.max_sub_tokens,
         }
@@ -431,17 +530,10 @@ class RLM:
         up the initial message history.
         """
         metadata = QueryMetadata(prompt)
-        message_history = cast(
-            list[dict[str, Any]],
-            build_rlm_system_prompt(
-                system_prompt=self.system_prompt,
-                query_metadata=metadata,
-                custom_tools=self.custom_tools,
-                compaction=self.compaction,
-            ),
-        )
-
-        return message_history
+        return [
+            {"role": "system", "content": self._system_prompt_content},
+            {"role": "user", "content": build_metadata_prompt(metadata)},
+        ]
 
     def completion(
         self, prompt: str | dict[str, Any], root_prompt: str | None = None
@@ -482,7 +574,11 @@ class RLM:
                     message_history=message_history,
                     compaction_count=0,
                     time_start=time_start,
+                    token_counter=(
+                        IncrementalTokenCounter(self.root_model) if self.compaction else None
+                    ),
                 )
+                self._rehash_prefix(loop_state)
                 return self._run_iteration_loop(loop_state)
         finally:
             self._active_time_start = previous_time_start
@@ -496,12 +592,17 @@ class RLM:
         for i in range(self.max_iterations):
             self._check_iteration_limits(loop_state)
 
+            previous_compaction_count = loop_state.compaction_count
             loop_state.message_history, loop_state.compaction_count = self._maybe_compact(
                 loop_state.lm_handler,
                 loop_state.environment,
                 loop_state.message_history,
                 loop_state.compaction_count,
+                loop_state.token_counter,
+                loop_state.env_caps,
             )
+            if loop_state.compaction_count != previous_compaction_count:
+                self._rehash_prefix(loop_state)
 
             iteration = self._run_single_iteration(loop_state, i)
             self._update_error_count(iteration)
@@ -608,7 +709,7 @@ class RLM:
     def _build_iteration_prompt(
         self, loop_state: _LoopState, iteration_index: int
     ) -> list[dict[str, Any]]:
-        context_count, history_count = self._get_prompt_counts(loop_state.environment)
+        context_count, history_count = self._get_prompt_counts(loop_state)
         if self.enable_prefix_cache:
             return self._cached_prompt(
                 loop_state.message_history,
@@ -616,15 +717,27 @@ class RLM:
                 iteration_index,
                 context_count,
                 history_count,
+                prefix_hash=loop_state.prefix_hash,
             )
 
-        return loop_state.message_history + [
-            build_user_prompt(loop_state.root_prompt, iteration_index, context_count, history_count)
+        # A fresh list is required: the prompt is stored on RLMIteration and logged,
+        # so appending to message_history in place would alias later turns into it.
+        return [
+            *loop_state.message_history,
+            build_user_prompt(
+                loop_state.root_prompt, iteration_index, context_count, history_count
+            ),
         ]
 
-    def _get_prompt_counts(self, environment: BaseEnv) -> tuple[int, int]:
-        if not isinstance(environment, SupportsPersistence):
+    def _rehash_prefix(self, loop_state: _LoopState) -> None:
+        """Recompute the rolling prefix hash after message_history is replaced."""
+        if self.enable_prefix_cache:
+            loop_state.prefix_hash = _fold_prefix_hash(0, loop_state.message_history)
+
+    def _get_prompt_counts(self, loop_state: _LoopState) -> tuple[int, int]:
+        if not loop_state.env_caps.supports_persistence:
             return 1, 0
+        environment = cast(SupportsPersistence, loop_state.environment)
         return environment.get_context_count(), environment.get_history_count()
 
     def _record_iteration(
@@ -640,7 +753,9 @@ class RLM:
     def _append_iteration_messages(self, loop_state: _LoopState, iteration: RLMIteration) -> None:
         new_messages = format_iteration(iteration)
         loop_state.message_history.extend(new_messages)
-        if self.compaction and hasattr(loop_state.environment, "append_compaction_entry"):
+        if self.enable_prefix_cache:
+            loop_state.prefix_hash = _fold_prefix_hash(loop_state.prefix_hash, new_messages)
+        if self.compaction and loop_state.env_caps.supports_compaction:
             loop_state.environment.append_compaction_entry(new_messages)
 
     def _finalize_completion(
@@ -651,12 +766,16 @@ class RLM:
     ) -> RLMChatCompletion:
         time_end = time.perf_counter()
         usage = loop_state.lm_handler.get_usage_summary()
-        self.verbose.print_final_answer(response)
-        self.verbose.print_summary(
-            iteration_count, time_end - loop_state.time_start, usage.to_dict()
-        )
-        if self.persistent and isinstance(loop_state.environment, SupportsPersistence):
-            loop_state.environment.add_history(loop_state.message_history)
+        # Guarded here so usage.to_dict() is not built when nothing is printed.
+        if self.verbose.enabled:
+            self.verbose.print_final_answer(response)
+            self.verbose.print_summary(
+                iteration_count, time_end - loop_state.time_start, usage.to_dict()
+            )
+        if self.persistent and loop_state.env_caps.supports_persistence:
+            cast(SupportsPersistence, loop_state.environment).add_history(
+                loop_state.message_history
+            )
         return self._build_completion_result(
             prompt=loop_state.prompt,
             response=response,
@@ -670,12 +789,18 @@ class RLM:
         environment: BaseEnv,
         message_history: list[dict[str, Any]],
         compaction_count: int,
+        token_counter: IncrementalTokenCounter | None = None,
+        env_caps: _EnvCaps | None = None,
     ) -> tuple[list[dict[str, Any]], int]:
         """Run compaction when enabled and threshold is reached."""
-        if not (self.compaction and hasattr(environment, "append_compaction_entry")):
+        if env_caps is None:
+            env_caps = _EnvCaps.probe(environment)
+        if not (self.compaction and env_caps.supports_compaction):
             return message_history, compaction_count
 
-        current_tokens, threshold_tokens, max_tokens = self._get_compaction_status(message_history)
+        current_tokens, threshold_tokens, max_tokens = self._get_compaction_status(
+            message_history, token_counter
+        )
         self.verbose.print_compaction_status(current_tokens, threshold_tokens, max_tokens)
         if current_tokens < threshold_tokens:
             return message_history, compaction_count
@@ -698,12 +823,9 @@ class RLM:
         execution_time: float,
     ) -> RLMChatCompletion:
         """Build the normalized completion return payload."""
-        root_model = (
-            self.backend_kwargs.get("model_name", "unknown") if self.backend_kwargs else "unknown"
-        )
         metadata = self.logger.get_trajectory() if self.logger else None
         return RLMChatCompletion(
-            root_model,
+            self.root_model,
             prompt,
             response,
             usage,
@@ -723,10 +845,22 @@ class RLM:
         """
         iter_start = time.perf_counter()
         if self.on_root_chunk is not None and self.depth == 0:
-            response = lm_handler.completion(prompt, on_chunk=self.on_root_chunk)
+            on_root_chunk = self.on_root_chunk
+            scanner = FenceScanner()
+
+            def on_chunk(chunk: str) -> None:
+                scanner.feed(chunk)
+                on_root_chunk(chunk)
+
+            response = lm_handler.completion(prompt, on_chunk=on_chunk)
+            # Trust the streamed parse only if the chunks covered the whole response.
+            if scanner.length == len(response):
+                code_block_strs = scanner.blocks
+            else:
+                code_block_strs = find_code_blocks(response)
         else:
             response = lm_handler.completion(prompt)
-        code_block_strs = find_code_blocks(response)
+            code_block_strs = find_code_blocks(response)
         code_blocks: list[CodeBlock] = []
 
         for code_block_str in code_block_strs:
@@ -756,20 +890,31 @@ class RLM:
         iteration_index: int,
         context_count: int,
         history_count: int,
+        prefix_hash: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Build current prompt using a prefix cache keyed by conversation state."""
+        """Build current prompt using a prefix cache keyed by conversation state.
+
+        Entries are keyed by (length, rolling hash of the whole prefix) and evicted in
+        least-recently-used order. Pass the loop's maintained prefix_hash to avoid
+        rehashing the history.
+        """
         user_prompt = build_user_prompt(root_prompt, iteration_index, context_count, history_count)
-        prefix_key = (
-            f"{len(message_history)}:{hash(str(message_history[-1])) if message_history else 0}"
-        )
+        if prefix_hash is None:
+            prefix_hash = _fold_prefix_hash(0, message_history)
+        prefix_key = (len(message_history), prefix_hash)
 
-        cached_prefix = self._prefix_prompt_cache.get(prefix_key)
+        cache = self._prefix_prompt_cache
+        cached_prefix = cache.get(prefix_key)
         if cached_prefix is None:
+            self._prefix_cache_misses += 1
             cached_prefix = list(message_history)
-            self._prefix_prompt_cache[prefix_key] = cached_prefix
-            if len(self._prefix_prompt_cache) > 128:
-                oldest_key = next(iter(self._prefix_prompt_cache))
-                del self._prefix_prompt_cache[oldest_key]
+            cache[prefix_key] = cached_prefix
+            if len(cache) > _PREFIX_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+                self._prefix_cache_evictions += 1
+        else:
+            self._prefix_cache_hits += 1
+            cache.move_to_end(prefix_key)
 
         return [*cached_prefix, user_prompt]
 
@@ -777,13 +922,30 @@ class RLM:
     # Compaction helpers
     # ------------------------------------------------------------------
 
-    def _get_compaction_status(self, message_history: list[dict[str, Any]]) -> tuple[int, int, int]:
-        """Return (current_tokens, threshold_tokens, max_tokens) for compaction."""
-        model_name = (
-            self.backend_kwargs.get("model_name", "unknown") if self.backend_kwargs else "unknown"
-        )
-        max_tokens = get_context_limit(model_name)
-        current_tokens = count_tokens(message_history, model_name)
+    def _get_compaction_status(
+        self,
+        message_history: list[dict[str, Any]],
+        token_counter: IncrementalTokenCounter | None = None,
+    ) -> tuple[int, int, int]:
+        """Return (current_tokens, threshold_tokens, max_tokens) for compaction.
+
+        With a token_counter (one per completion), the context limit is looked up once,
+        only messages appended since the last check are tokenized, and tokenization is
+        skipped (reporting the character estimate) while a cheap upper bound on the
+        count stays below the threshold.
+        """
+        if token_counter is not None:
+            max_tokens = token_counter.context_limit
+            threshold_tokens = int(self.compaction_threshold_pct * max_tokens)
+            # Defer tokenization while even the worst case stays under the threshold.
+            if token_counter.upper_bound(message_history) < threshold_tokens:
+                current_tokens = token_counter.estimate(message_history)
+            else:
+                current_tokens = token_counter.count(message_history)
+            return current_tokens, threshold_tokens, max_tokens
+
+        max_tokens = get_context_limit(self.root_model)
+        current_tokens = count_tokens(message_history, self.root_model)
         threshold_tokens = int(self.compaction_threshold_pct * max_tokens)
         return current_tokens, threshold_tokens, max_tokens
 
@@ -798,19 +960,9 @@ class RLM:
         Summarize current trajectory, append summary to REPL history, and return
         a short message_history with the summary as the new starting point.
         """
-        summary_prompt = message_history + [
-            {
-                "role": "user",
-                "content": (
-                    "Summarize your progress so far. Include:\n"
-                    "1. Which steps/sub-tasks you have completed and which remain.\n"
-                    "2. Any concrete intermediate results (numbers, values, variable names) "
-                    "you computed — preserve these exactly.\n"
-                    "3. What your next action should be.\n"
-                    "Be concise (1–3 paragraphs) but preserve all key results and your "
-                    "current position in the task."
-                ),
-            }
+        summary_prompt = [
+            *message_history,
+            {"role": "user", "content": _COMPACTION_SUMMARY_PROMPT},
         ]
         summary = lm_handler.completion(summary_prompt)
         if hasattr(environment, "append_compaction_entry"):
@@ -820,13 +972,7 @@ class RLM:
             {"role": "assistant", "content": summary},
             {
                 "role": "user",
-                "content": (
-                    f"Your conversation has been compacted {compaction_count} time(s). "
-                    "Continue from the above summary. Do NOT repeat work you have already "
-                    "completed. Use SHOW_VARS() to check which REPL variables exist, "
-                    "and check `history` for full context. "
-                    "Your next action:"
-                ),
+                "content": _COMPACTION_CONTINUE_TEMPLATE.format(count=compaction_count),
             },
         ]
         return new_history
@@ -844,11 +990,9 @@ class RLM:
         Default behavior if the RLM runs out of iterations and does not find a final answer.
         It will take the message history, and try to generate a final answer from it.
         """
-        current_prompt = message_history + [
-            {
-                "role": "assistant",
-                "content": "Please provide a final answer to the user's question based on the information provided.",
-            }
+        current_prompt = [
+            *message_history,
+            {"role": "assistant", "content": _DEFAULT_ANSWER_PROMPT},
         ]
         response = lm_handler.completion(current_prompt)
 
@@ -868,7 +1012,13 @@ class RLM:
         """
         Fallback behavior if the RLM is actually at max depth, and should be treated as an LM.
         """
-        client: BaseLM = get_client(cast(ClientBackend, self.backend), self.backend_kwargs or {})
+        # Reused across fallback calls; usage is reported per call from snapshots.
+        if self._fallback_client is None:
+            self._fallback_client = get_client(
+                cast(ClientBackend, self.backend), self.backend_kwargs or {}
+            )
+        client = self._fallback_client
+        usage_before = client.get_usage_summary()
         start_time = time.perf_counter()
         if isinstance(message, dict):
             normalized_message: str | list[dict[str, Any]] = str(message)
@@ -876,7 +1026,7 @@ class RLM:
             normalized_message = message
         response = client.completion(normalized_message)
         end_time = time.perf_counter()
-        usage = client.get_usage_summary()
+        usage = _usage_since(usage_before, client.get_usage_summary())
         return self._build_completion_result(
             prompt=normalized_message,
             response=response,
@@ -884,6 +1034,21 @@ class RLM:
             execution_time=end_time - start_time,
         )
 
+    def get_prefix_cache_stats(self) -> dict[str, Any]:
+        """Get prefix prompt cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        return {
+            "enabled": self.enable_prefix_cache,
+            "size": len(self._prefix_prompt_cache),
+            "max_size": _PREFIX_CACHE_MAX_ENTRIES,
+            "hits": self._prefix_cache_hits,
+            "misses": self._prefix_cache_misses,
+            "evictions": self._prefix_cache_evictions,
+        }
+
     def _validate_persistent_environment_support(self) -> None:
         """
         Validate that the configured environment type supports persistent mode.
@@ -19,7 +19,6 @@ from rlm.core.sandbox.ast_validator import (
 )
 from rlm.core.sandbox.restricted_exec import (
     BlockedModule,
-    RestrictedBuiltins,
     create_restricted_environment,
     restore_sys_modules,
     setup_runtime_blocking,
@@ -32,7 +31,6 @@ from rlm.core.sandbox.safe_builtins import (
 __all__ = [
     "ASTValidationError",
     "BlockedModule",
-    "RestrictedBuiltins",
     "create_restricted_environment",
     "get_safe_builtins",
     "get_safe_builtins_for_repl",
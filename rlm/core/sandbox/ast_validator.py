@@ -1,6 +1,12 @@
 """AST-based code validation for sandboxed execution."""
 
 import ast
+import functools
+import re
+from collections.abc import Callable
+from typing import Any
+
+from rlm.core.sandbox.constants import BLOCKED_FUNCTIONS, BLOCKED_MODULES
 
 
 class ASTValidationError(Exception):
@@ -16,55 +22,57 @@ class ASTValidationError(Exception):
         self.message = message
 
 
-# Blocked modules (network, process, filesystem)
-_BLOCKED_MODULES = {
-    "socket",
-    "requests",
-    "urllib",
-    "urllib2",
-    "http",
-    "httpx",
-    "subprocess",
-    "multiprocessing",
-    "os",
-    "sys",
-    "shutil",
-    "pickle",
-    "marshal",
-    "ctypes",
-    "importlib",
-    "__builtin__",
-    "builtins",
-    "imp",
-    "pkgutil",
-    "pydoc",
-    "runpy",
-    "zipimport",
-}
+# Every check matches a blocked module or function name, or ``__builtins__``, as a
+# whole identifier. ASCII source without any of them cannot fail validation, so the
+# tree walk is skipped. Non-ASCII source is always walked because the parser
+# NFKC-normalizes identifiers (e.g. a fullwidth "ｅｖａｌ" becomes "eval").
+_SUSPICIOUS_IDENTIFIER_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(name) for name in sorted(BLOCKED_MODULES | BLOCKED_FUNCTIONS))
+    + r"|__builtins__)\b",
+    re.ASCII,
+)
 
-# Blocked function calls
-_BLOCKED_FUNCTIONS = {
-    "eval",
-    "exec",
-    "compile",
-    "__import__",
-    "open",
-    "file",
-    "input",
-    "raw_input",
-    "execfile",
-    "reload",
-    "exit",
-    "quit",
-}
+# Source made only of characters the tokenizer treats as whitespace always parses to
+# an empty module. str.isspace() is broader (e.g. U+00A0 is a syntax error).
+_BLANK_SOURCE_PATTERN = re.compile(r"[ \t\r\n\f]*")
+
+# Nodes that have no children able to hold an import, call or subscript.
+_LEAF_NODE_TYPES = (
+    ast.Name,
+    ast.Constant,
+    ast.expr_context,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+    ast.boolop,
+)
+
+
+def _concrete_subclasses(bases: tuple[type, ...]) -> frozenset[type]:
+    """Collect bases and all their subclasses, so membership replaces isinstance."""
+    found: set[type] = set()
+    pending = list(bases)
+    while pending:
+        cls = pending.pop()
+        if cls not in found:
+            found.add(cls)
+            pending.extend(cls.__subclasses__())
+    return frozenset(found)
+
+
+# Exact classes for the leaf filter: a set lookup per child instead of an isinstance
+# call that tries each base (abstract ones via their MRO) in turn.
+_LEAF_NODE_CLASSES: frozenset[type] = _concrete_subclasses(_LEAF_NODE_TYPES)
 
-BLOCKED_MODULES: frozenset[str] = frozenset(_BLOCKED_MODULES)
-BLOCKED_FUNCTIONS: frozenset[str] = frozenset(_BLOCKED_FUNCTIONS)
+
+# Parsed trees only contain the concrete ast classes, so the checks below compare
+# type(node) with "is" rather than calling isinstance.
 
 
 def _extract_string_constant(node: ast.AST) -> str | None:
     """Extract string values from AST constant nodes."""
-    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+    if type(node) is ast.Constant and isinstance(node.value, str):
         return node.value
     return None
 
@@ -78,15 +86,15 @@ def _check_import_node(node: ast.AST) -> str | None:
     Returns:
         Error message if blocked, None otherwise
     """
-    if isinstance(node, ast.Import):
+    if type(node) is ast.Import:
         for alias in node.names:
             module_name = alias.name.split(".")[0]
-            if module_name in _BLOCKED_MODULES:
+            if module_name in BLOCKED_MODULES:
                 return f"Blocked import: {alias.name}"
-    if isinstance(node, ast.ImportFrom):
+    if type(node) is ast.ImportFrom:
         if node.module:
             module_name = node.module.split(".")[0]
-            if module_name in _BLOCKED_MODULES:
+            if module_name in BLOCKED_MODULES:
                 return f"Blocked import: {node.module}"
     return None
 
@@ -100,14 +108,16 @@ def _check_call_node(node: ast.Call) -> str | None:
     Returns:
         Error message if blocked, None otherwise
     """
-    if isinstance(node.func, ast.Name):
-        if node.func.id in _BLOCKED_FUNCTIONS:
-            return f"Blocked function call: {node.func.id}()"
-    elif isinstance(node.func, ast.Attribute):
+    func = node.func
+    func_type = type(func)
+    if func_type is ast.Name:
+        if func.id in BLOCKED_FUNCTIONS:
+            return f"Blocked function call: {func.id}()"
+    elif func_type is ast.Attribute:
         # Check for os.system, subprocess.call, etc.
-        if isinstance(node.func.value, ast.Name):
-            if node.func.value.id in _BLOCKED_MODULES:
-                return f"Blocked module call: {node.func.value.id}.{node.func.attr}()"
+        target = func.value
+        if type(target) is ast.Name and target.id in BLOCKED_MODULES:
+            return f"Blocked module call: {target.id}.{func.attr}()"
     return None
 
 
@@ -136,42 +146,29 @@ def _check_getattr_builtin_access(node: ast.Call) -> str | None:
     if attr_name is None:
         return None
 
-    if attr_name in _BLOCKED_FUNCTIONS:
+    if attr_name in BLOCKED_FUNCTIONS:
         return f"Blocked dynamic access to builtin: getattr(__builtins__, '{attr_name}')"
 
     return None
 
 
 def _is_getattr_call(node: ast.Call) -> bool:
-    return isinstance(node.func, ast.Name) and node.func.id == "getattr"
+    func = node.func
+    return type(func) is ast.Name and func.id == "getattr"
 
 
 def _is_builtins_access_target(node: ast.AST) -> bool:
-    if isinstance(node, ast.Name):
+    node_type = type(node)
+    if node_type is ast.Name:
         return node.id == "__builtins__"
 
-    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
-        return node.value.id == "__builtins__"
+    if node_type is ast.Attribute:
+        target = node.value
+        return type(target) is ast.Name and target.id == "__builtins__"
 
     return False
 
 
-def _check_node_safety(node: ast.AST) -> str | None:
-    if isinstance(node, (ast.Import, ast.ImportFrom)):
-        return _check_import_node(node)
-
-    if isinstance(node, ast.Call):
-        error = _check_call_node(node)
-        if error:
-            return error
-        return _check_getattr_builtin_access(node)
-
-    if isinstance(node, ast.Subscript):
-        return _check_subscript_builtin_access(node)
-
-    return None
-
-
 def _check_subscript_builtin_access(node: ast.Subscript) -> str | None:
     """Check if dictionary-style access to dangerous builtins is attempted.
 
@@ -181,14 +178,15 @@ def _check_subscript_builtin_access(node: ast.Subscript) -> str | None:
     Returns:
         Error message if blocked, None otherwise
     """
-    if not isinstance(node.value, ast.Name) or node.value.id != "__builtins__":
+    target = node.value
+    if type(target) is not ast.Name or target.id != "__builtins__":
         return None
 
     key = _extract_string_constant(node.slice)
     if key is None:
         return None
 
-    if key in _BLOCKED_FUNCTIONS:
+    if key in BLOCKED_FUNCTIONS:
         return f"Blocked dictionary access to builtin: __builtins__['{key}']"
 
     return None
@@ -205,12 +203,67 @@ def validate_ast(code: str) -> None:
         ASTValidationError: If code contains blocked operations
         SyntaxError: If code has invalid Python syntax
     """
+    if _BLANK_SOURCE_PATTERN.fullmatch(code):
+        return
+    error = _validation_error(code)
+    if error is not None:
+        raise ASTValidationError(error)
+
+
+@functools.lru_cache(maxsize=256)
+def _validation_error(code: str) -> str | None:
+    """Return the validation error message for code, or None if it is allowed.
+
+    Cached on the full source string, so repeated snippets skip parsing and the walk.
+    Sources are bounded by the exec size limit, which bounds the cache's memory.
+    """
     try:
-        tree = ast.parse(code, mode="exec")
+        # ast.parse minus its Python wrapper; "<unknown>" keeps its error text.
+        tree = compile(code, "<unknown>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
     except SyntaxError as e:
-        raise ASTValidationError(f"Invalid Python syntax: {e}") from e
+        return f"Invalid Python syntax: {e}"
+
+    # Parsing still runs first so syntax errors are reported for clean code too.
+    if code.isascii() and _SUSPICIOUS_IDENTIFIER_PATTERN.search(code) is None:
+        return None
+
+    return _find_blocked_construct(tree)
+
+
+def _check_call_combined(node: ast.Call) -> str | None:
+    """Run every call check: blocked names, module calls and getattr on builtins."""
+    return _check_call_node(node) or _check_getattr_builtin_access(node)
 
-    for node in ast.walk(tree):
-        error = _check_node_safety(node)
-        if error:
-            raise ASTValidationError(error)
+
+# Checks keyed by exact node class; one dict lookup per node replaces an isinstance ladder.
+_NODE_CHECKS: dict[type[ast.AST], Callable[[Any], str | None]] = {
+    ast.Import: _check_import_node,
+    ast.ImportFrom: _check_import_node,
+    ast.Call: _check_call_combined,
+    ast.Subscript: _check_subscript_builtin_access,
+}
+
+
+def _find_blocked_construct(tree: ast.AST) -> str | None:
+    """Return the first blocked construct's error message in source order, or None.
+
+    Traversal uses an explicit stack rather than recursion, because long expression
+    chains that ast.parse accepts would otherwise exhaust the Python stack. Leaf
+    nodes are never pushed.
+    """
+    stack = [tree]
+    while stack:
+        current = stack.pop()
+        check = _NODE_CHECKS.get(current.__class__)
+        if check is not None:
+            error = check(current)
+            if error:
+                return error
+        children = [
+            child
+            for child in ast.iter_child_nodes(current)
+            if child.__class__ not in _LEAF_NODE_CLASSES
+        ]
+        # Reversed so nodes are checked in source order.
+        stack.extend(reversed(children))
+    return None
@@ -0,0 +1,54 @@
+"""Blocklists shared by the sandbox AST validator and runtime blocking."""
+
+# Modules swapped for a BlockedModule in sys.modules while sandboxed code runs
+# (network, process, filesystem, serialization, import machinery).
+RUNTIME_BLOCKED_MODULES: tuple[str, ...] = (
+    "socket",
+    "requests",
+    "urllib",
+    "urllib2",
+    "http",
+    "httpx",
+    "subprocess",
+    "multiprocessing",
+    "os",
+    "sys",
+    "shutil",
+    "pickle",
+    "marshal",
+    "ctypes",
+    "importlib",
+)
+
+# Modules the AST validator refuses to import: the runtime list plus builtins and
+# loader modules, which cannot be replaced in sys.modules without breaking the
+# interpreter itself.
+BLOCKED_MODULES: frozenset[str] = frozenset(RUNTIME_BLOCKED_MODULES) | frozenset(
+    {
+        "__builtin__",
+        "builtins",
+        "imp",
+        "pkgutil",
+        "pydoc",
+        "runpy",
+        "zipimport",
+    }
+)
+
+# Blocked function calls
+BLOCKED_FUNCTIONS: frozenset[str] = frozenset(
+    {
+        "eval",
+        "exec",
+        "compile",
+        "__import__",
+        "open",
+        "file",
+        "input",
+        "raw_input",
+        "execfile",
+        "reload",
+        "exit",
+        "quit",
+    }
+)
@@ -4,12 +4,15 @@ import sys
 from types import ModuleType
 from typing import Any, cast
 
-from rlm.core.sandbox.safe_builtins import get_safe_builtins
+from rlm.core.sandbox.constants import RUNTIME_BLOCKED_MODULES
+from rlm.core.sandbox.safe_builtins import SAFE_BUILTINS
 
 
 class BlockedModule:
     """Blocked module that raises error on any access."""
 
+    __slots__ = ()
+
     def __getattr__(self, name: str) -> None:
         """Block any attribute access.
 
@@ -40,106 +43,20 @@ class BlockedModule:
         )
 
 
-# Modules to block at runtime
-_BLOCKED_MODULES_LIST = [
-    "socket",
-    "requests",
-    "urllib",
-    "urllib2",
-    "http",
-    "httpx",
-    "subprocess",
-    "multiprocessing",
-    "os",
-    "sys",
-    "shutil",
-    "pickle",
-    "marshal",
-    "ctypes",
-    "importlib",
-]
-
-
-class RestrictedBuiltins:
-    """Restricted builtins that blocks dangerous attribute access."""
-
-    def __init__(self, safe_dict: dict[str, Any]) -> None:
-        """Initialize restricted builtins.
+_BLOCKED_MODULES_SET: frozenset[str] = frozenset(RUNTIME_BLOCKED_MODULES)
+# Submodule prefixes ("os." etc.); the trailing dot keeps e.g. "httpx_client" importable-by-name.
+_BLOCKED_MODULE_PREFIXES: tuple[str, ...] = tuple(f"{name}." for name in RUNTIME_BLOCKED_MODULES)
 
-        Args:
-            safe_dict: Dictionary of safe builtins
-        """
-        object.__setattr__(self, "_safe", safe_dict)
+# BlockedModule is stateless, so one instance stands in for every blocked module.
+_BLOCKED_MODULE_ENTRIES: dict[str, ModuleType] = dict.fromkeys(
+    RUNTIME_BLOCKED_MODULES, cast(ModuleType, BlockedModule())
+)
 
-    def __getattr__(self, name: str) -> Any:
-        """Get attribute with blocking for dangerous builtins.
-
-        Args:
-            name: Attribute name
-
-        Returns:
-            Safe builtin value
-
-        Raises:
-            AttributeError: If attribute is blocked or not available
-        """
-        blocked_attrs = {
-            "__import__",
-            "eval",
-            "exec",
-            "compile",
-            "open",
-            "file",
-            "input",
-            "globals",
-            "locals",
-        }
-        if name in blocked_attrs:
-            raise AttributeError(f"Access to '{name}' is blocked for security (R3 compliance)")
-        if name in self._safe:
-            return self._safe[name]
-        raise AttributeError(f"'{name}' is not available in sandbox")
-
-    def __setattr__(self, name: str, value: Any) -> None:
-        """Block setting dangerous attributes.
-
-        Args:
-            name: Attribute name
-            value: Attribute value
-
-        Raises:
-            AttributeError: If trying to modify builtins
-        """
-        if name.startswith("_"):
-            object.__setattr__(self, name, value)
-        else:
-            raise AttributeError(f"Cannot modify builtins in sandbox (R3 compliance): '{name}'")
-
-    def __getitem__(self, key: str) -> Any:
-        """Block dictionary-style access to dangerous builtins.
-
-        Args:
-            key: Dictionary key
-
-        Returns:
-            Safe builtin value
-
-        Raises:
-            KeyError: If key is blocked or not available
-        """
-        blocked_attrs = {
-            "__import__",
-            "eval",
-            "exec",
-            "compile",
-            "open",
-            "file",
-        }
-        if key in blocked_attrs:
-            raise KeyError(f"Access to '{key}' is blocked for security (R3 compliance)")
-        if key in self._safe:
-            return self._safe[key]
-        raise KeyError(f"'{key}' is not available in sandbox")
+# Strict-sandbox builtins with blocked names (None in the template) dropped so they
+# stay NameErrors. Copied per environment rather than rebuilt.
+_STRICT_BUILTINS: dict[str, Any] = {
+    name: value for name, value in SAFE_BUILTINS.items() if value is not None
+}
 
 
 def _create_safe_import() -> Any:
@@ -148,7 +65,6 @@ def _create_safe_import() -> Any:
     Returns:
         Function that raises ImportError
     """
-    blocked = set(_BLOCKED_MODULES_LIST)
 
     def safe_import(name: str, *args: Any, **kwargs: Any) -> None:
         """Block all imports for security.
@@ -161,7 +77,7 @@ def _create_safe_import() -> Any:
         Raises:
             ImportError: Always raised to block imports
         """
-        if name in blocked or any(name.startswith(b) for b in blocked):
+        if name in _BLOCKED_MODULES_SET or name.startswith(_BLOCKED_MODULE_PREFIXES):
             raise ImportError(f"Import of '{name}' is blocked for security (R3 compliance)")
         # For allowed imports, we still block them at AST level, but this is defense in depth
         raise ImportError("Direct imports are not allowed in sandbox")
@@ -176,11 +92,12 @@ def setup_runtime_blocking() -> dict[str, Any]:
     Returns:
         Dictionary mapping module names to original module objects (for restoration)
     """
-    original_modules: dict[str, Any] = {}
-    for mod_name in _BLOCKED_MODULES_LIST:
-        if mod_name in sys.modules:
-            original_modules[mod_name] = sys.modules[mod_name]
-        sys.modules[mod_name] = cast(ModuleType, BlockedModule())
+    original_modules: dict[str, Any] = {
+        mod_name: sys.modules[mod_name]
+        for mod_name in RUNTIME_BLOCKED_MODULES
+        if mod_name in sys.modules
+    }
+    sys.modules.update(_BLOCKED_MODULE_ENTRIES)
     return original_modules
 
 
@@ -191,12 +108,10 @@ def restore_sys_modules(original_modules: dict[str, Any]) -> None:
     Args:
         original_modules: Dictionary of original module objects to restore
     """
-    for mod_name, mod_obj in original_modules.items():
-        sys.modules[mod_name] = mod_obj
+    sys.modules.update(original_modules)
     # Remove blocked modules if they weren't there originally
-    for mod_name in _BLOCKED_MODULES_LIST:
-        if mod_name not in original_modules:
-            sys.modules.pop(mod_name, None)
+    for mod_name in _BLOCKED_MODULES_SET.difference(original_modules):
+        sys.modules.pop(mod_name, None)
 
 
 def create_restricted_environment() -> tuple[dict[str, Any], dict[str, Any]]:
@@ -206,15 +121,15 @@ def create_restricted_environment() -> tuple[dict[str, Any], dict[str, Any]]:
     Returns:
         Tuple of (restricted_globals, restricted_locals) dictionaries
     """
-    safe_builtins = get_safe_builtins()
-    safe_builtins["__import__"] = _create_safe_import()
-
-    # Replace safe_builtins dict with RestrictedBuiltins class
-    restricted_builtins_obj = RestrictedBuiltins(safe_builtins)
+    # A plain dict keeps builtin name lookups on CPython's dict fast path; a mapping
+    # object as __builtins__ costs a __getitem__ call per lookup and breaks import
+    # statements. __import__ is replaced with the blocking stub.
+    restricted_builtins = _STRICT_BUILTINS.copy()
+    restricted_builtins["__import__"] = _create_safe_import()
 
     # Create restricted execution environment
     restricted_globals: dict[str, Any] = {
-        "__builtins__": restricted_builtins_obj,
+        "__builtins__": restricted_builtins,
         "__name__": "__main__",
         "__doc__": None,
         "__file__": None,
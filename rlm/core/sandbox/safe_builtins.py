@@ -5,8 +5,106 @@ Two variants:
 - get_safe_builtins_for_repl(): For REPL environments. Adds globals, locals, __import__, open.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Built once at import; get_safe_builtins() hands out shallow copies of this.
+_SAFE_BUILTINS: dict[str, Any] = {
+    # Core types and functions
+    "print": print,
+    "len": len,
+    "str": str,
+    "int": int,
+    "float": float,
+    "list": list,
+    "dict": dict,
+    "set": set,
+    "tuple": tuple,
+    "bool": bool,
+    "type": type,
+    "isinstance": isinstance,
+    "issubclass": issubclass,
+    "enumerate": enumerate,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+    "sorted": sorted,
+    "reversed": reversed,
+    "range": range,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "abs": abs,
+    "round": round,
+    "any": any,
+    "all": all,
+    "pow": pow,
+    "divmod": divmod,
+    "chr": chr,
+    "ord": ord,
+    "hex": hex,
+    "bin": bin,
+    "oct": oct,
+    "repr": repr,
+    "ascii": ascii,
+    "format": format,
+    "hash": hash,
+    "id": id,
+    "iter": iter,
+    "next": next,
+    "slice": slice,
+    "callable": callable,
+    "hasattr": hasattr,
+    "getattr": getattr,
+    "setattr": setattr,
+    "delattr": delattr,
+    "dir": dir,
+    "vars": vars,
+    "bytes": bytes,
+    "bytearray": bytearray,
+    "memoryview": memoryview,
+    "complex": complex,
+    "object": object,
+    "super": super,
+    "property": property,
+    "staticmethod": staticmethod,
+    "classmethod": classmethod,
+    # Exceptions
+    "BaseException": BaseException,
+    "Exception": Exception,
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+    "KeyError": KeyError,
+    "IndexError": IndexError,
+    "AttributeError": AttributeError,
+    "FileNotFoundError": FileNotFoundError,
+    "OSError": OSError,
+    "IOError": IOError,
+    "RuntimeError": RuntimeError,
+    "NameError": NameError,
+    "ImportError": ImportError,
+    "StopIteration": StopIteration,
+    "AssertionError": AssertionError,
+    "NotImplementedError": NotImplementedError,
+    "ArithmeticError": ArithmeticError,
+    "LookupError": LookupError,
+    "Warning": Warning,
+    # Blocked (set to None to prevent access)
+    "input": None,
+    "eval": None,
+    "exec": None,
+    "compile": None,
+    "globals": None,
+    "locals": None,
+    "__import__": None,
+    "open": None,
+    "file": None,
+}
+
+# Read-only view for callers that only look names up.
+SAFE_BUILTINS: Mapping[str, Any] = MappingProxyType(_SAFE_BUILTINS)
+
 
 def get_safe_builtins() -> dict[str, Any]:
     """
@@ -16,99 +114,9 @@ def get_safe_builtins() -> dict[str, Any]:
     not include globals/locals/__import__/open for maximum security.
 
     Returns:
-        Dictionary of safe builtins for restricted execution
+        Fresh dictionary of safe builtins for restricted execution (safe to mutate)
     """
-    return {
-        # Core types and functions
-        "print": print,
-        "len": len,
-        "str": str,
-        "int": int,
-        "float": float,
-        "list": list,
-        "dict": dict,
-        "set": set,
-        "tuple": tuple,
-        "bool": bool,
-        "type": type,
-        "isinstance": isinstance,
-        "issubclass": issubclass,
-        "enumerate": enumerate,
-        "zip": zip,
-        "map": map,
-        "filter": filter,
-        "sorted": sorted,
-        "reversed": reversed,
-        "range": range,
-        "min": min,
-        "max": max,
-        "sum": sum,
-        "abs": abs,
-        "round": round,
-        "any": any,
-        "all": all,
-        "pow": pow,
-        "divmod": divmod,
-        "chr": chr,
-        "ord": ord,
-        "hex": hex,
-        "bin": bin,
-        "oct": oct,
-        "repr": repr,
-        "ascii": ascii,
-        "format": format,
-        "hash": hash,
-        "id": id,
-        "iter": iter,
-        "next": next,
-        "slice": slice,
-        "callable": callable,
-        "hasattr": hasattr,
-        "getattr": getattr,
-        "setattr": setattr,
-        "delattr": delattr,
-        "dir": dir,
-        "vars": vars,
-        "bytes": bytes,
-        "bytearray": bytearray,
-        "memoryview": memoryview,
-        "complex": complex,
-        "object": object,
-        "super": super,
-        "property": property,
-        "staticmethod": staticmethod,
-        "classmethod": classmethod,
-        # Exceptions
-        "BaseException": BaseException,
-        "Exception": Exception,
-        "ValueError": ValueError,
-        "TypeError": TypeError,
-        "KeyError": KeyError,
-        "IndexError": IndexError,
-        "AttributeError": AttributeError,
-        "FileNotFoundError": FileNotFoundError,
-        "OSError": OSError,
-        "IOError": IOError,
-        "RuntimeError": RuntimeError,
-        "NameError": NameError,
-        "ImportError": ImportError,
-        "StopIteration": StopIteration,
-        "AssertionError": AssertionError,
-        "NotImplementedError": NotImplementedError,
-        "ArithmeticError": ArithmeticError,
-        "LookupError": LookupError,
-        "Warning": Warning,
-        # Blocked (set to None to prevent access)
-        "input": None,
-        "eval": None,
-        "exec": None,
-        "compile": None,
-        "globals": None,
-        "locals": None,
-        "__import__": None,
-        "open": None,
-        "file": None,
-    }
+    return _SAFE_BUILTINS.copy()
 
 
 def get_safe_builtins_for_repl() -> dict[str, Any]:
@@ -172,7 +172,7 @@ class SnippetProvenance:
 ########################################################
 ########   Types for REPL and RLM Iterations   #########
 ########################################################
-@dataclass
+@dataclass(slots=True)
 class RLMChatCompletion:
     """Record of a single LLM call made from within the environment."""
 
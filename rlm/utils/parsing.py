@@ -10,22 +10,61 @@ from rlm.core.types import REPLResult, RLMIteration
 if TYPE_CHECKING:
     from rlm.environments.base_env import BaseEnv
 
+# Patterns are compiled once at import; every iteration scans the full model response.
+CODE_BLOCK_PATTERN = re.compile(r"```repl\s*\n(.*?)\n```", re.DOTALL)
+CODE_FENCE_PATTERN = re.compile(r"```.*?```", re.DOTALL)
+FINAL_VAR_PATTERN = re.compile(r"^\s*FINAL_VAR\((.*?)\)", re.MULTILINE | re.DOTALL)
+FINAL_PATTERN = re.compile(r"^\s*FINAL\((.*)\)\s*$", re.MULTILINE | re.DOTALL)
+
 
 def find_code_blocks(text: str) -> list[str]:
     """
     Find REPL code blocks in text wrapped in triple backticks and return List of content(s).
     Returns None if no code blocks are found.
     """
-    pattern = r"```repl\s*\n(.*?)\n```"
     results: list[str] = []
 
-    for match in re.finditer(pattern, text, re.DOTALL):
+    for match in CODE_BLOCK_PATTERN.finditer(text):
         code_content = match.group(1).strip()
         results.append(code_content)
 
     return results
 
 
+class FenceScanner:
+    """
+    Incrementally extract REPL code blocks from a streamed response.
+
+    Feeding every chunk of a response yields the same blocks, in the same order, as
+    find_code_blocks() on the concatenated text. Only the text after the last completed
+    block is kept and rescanned, and only when a chunk could have closed a fence.
+    """
+
+    def __init__(self) -> None:
+        self.blocks: list[str] = []
+        self.length = 0
+        self._pending = ""
+
+    def feed(self, chunk: str) -> list[str]:
+        """Consume a chunk and return the code blocks it completed."""
+        self.length += len(chunk)
+        # A closing fence may straddle the previous chunk boundary.
+        tail_start = max(len(self._pending) - 2, 0)
+        self._pending += chunk
+        if "```" not in self._pending[tail_start:]:
+            return []
+
+        completed: list[str] = []
+        consumed = 0
+        for match in CODE_BLOCK_PATTERN.finditer(self._pending):
+            completed.append(match.group(1).strip())
+            consumed = match.end()
+        if consumed:
+            self._pending = self._pending[consumed:]
+            self.blocks.extend(completed)
+        return completed
+
+
 def find_final_answer(text: str, environment: "BaseEnv | None" = None) -> str | None:
     """
     Find FINAL(...) or FINAL_VAR(...) statement in response and return the final answer string.
@@ -45,7 +84,10 @@ def find_final_answer(text: str, environment: "BaseEnv | None" = None) -> str |
     Returns:
         The final answer string, or None if no final answer pattern is found
     """
-    has_code_blocks = bool(find_code_blocks(text))
+    # Most responses carry no final marker at all; skip the regex passes for them.
+    if "FINAL" not in text:
+        return _consume_environment_final_answer(environment)
+
     text_without_code_fences = _strip_code_fences(text)
 
     final_var_name = _extract_final_var_name(text_without_code_fences)
@@ -55,7 +97,7 @@ def find_final_answer(text: str, environment: "BaseEnv | None" = None) -> str |
     # Skip text-based FINAL() when code blocks are present — the model should
     # use the FINAL() callable inside a REPL block instead.  This guards against
     # Claude-style hallucinated FINAL() in prose alongside code blocks.
-    if not has_code_blocks:
+    if CODE_BLOCK_PATTERN.search(text) is None:
         final_payload = _extract_final_payload(text_without_code_fences)
         if final_payload is not None:
             return final_payload
@@ -137,11 +179,13 @@ def convert_context_for_repl(context: Any) -> tuple[Any, str | None]:
 
 
 def _strip_code_fences(text: str) -> str:
-    return re.sub(r"```.*?```", "", text, flags=re.DOTALL)
+    if "```" not in text:
+        return text
+    return CODE_FENCE_PATTERN.sub("", text)
 
 
 def _extract_final_var_name(text: str) -> str | None:
-    final_var_match = re.search(r"^\s*FINAL_VAR\((.*?)\)", text, re.MULTILINE | re.DOTALL)
+    final_var_match = FINAL_VAR_PATTERN.search(text)
     if final_var_match is None:
         return None
     return final_var_match.group(1).strip().strip('"').strip("'")
@@ -158,7 +202,7 @@ def _resolve_final_var(variable_name: str, environment: "BaseEnv | None") -> str
 
 
 def _extract_final_payload(text: str) -> str | None:
-    final_match = re.search(r"^\s*FINAL\((.*)\)\s*$", text, re.MULTILINE | re.DOTALL)
+    final_match = FINAL_PATTERN.search(text)
     if final_match is None:
         return None
     return final_match.group(1).strip()
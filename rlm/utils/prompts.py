@@ -135,18 +135,26 @@ def build_rlm_system_prompt(
     Returns:
         List of message dictionaries
     """
+    return [
+        {
+            "role": "system",
+            "content": build_system_prompt_content(system_prompt, custom_tools, compaction),
+        },
+        {"role": "user", "content": build_metadata_prompt(query_metadata)},
+    ]
 
-    context_lengths = query_metadata.context_lengths
-    context_total_length = query_metadata.context_total_length
-    context_type = query_metadata.context_type
-
-    # If there are more than 100 chunks, truncate to the first 100 chunks.
-    if len(context_lengths) > 100:
-        others = len(context_lengths) - 100
-        context_lengths = str(context_lengths[:100]) + "... [" + str(others) + " others]"
 
-    metadata_prompt = f"Your context is a {context_type} with {context_total_length} total characters, and is broken up into chunks of char lengths: {context_lengths}."
+def build_system_prompt_content(
+    system_prompt: str,
+    custom_tools: dict[str, Any] | None = None,
+    compaction: bool = False,
+) -> str:
+    """
+    Build the query-independent system message content.
 
+    Depends only on RLM configuration, so callers can build it once and reuse it
+    across completions.
+    """
     prompt_content = system_prompt
     if custom_tools:
         tool_entries: list[str] = []
@@ -165,11 +173,21 @@ def build_rlm_system_prompt(
             "\n\nThe full conversation history (trajectory segments and any summaries) "
             "is available in the REPL variable `history` as a list."
         )
+    return prompt_content
 
-    return [
-        {"role": "system", "content": prompt_content},
-        {"role": "user", "content": metadata_prompt},
-    ]
+
+def build_metadata_prompt(query_metadata: QueryMetadata) -> str:
+    """Build the user message describing the shape of the query context."""
+    context_lengths = query_metadata.context_lengths
+    context_total_length = query_metadata.context_total_length
+    context_type = query_metadata.context_type
+
+    # If there are more than 100 chunks, truncate to the first 100 chunks.
+    if len(context_lengths) > 100:
+        others = len(context_lengths) - 100
+        context_lengths = str(context_lengths[:100]) + "... [" + str(others) + " others]"
+
+    return f"Your context is a {context_type} with {context_total_length} total characters, and is broken up into chunks of char lengths: {context_lengths}."
 
 
 USER_PROMPT = """Think step-by-step on what to do using the REPL environment (which contains the context) to answer the prompt.\n\nContinue using the REPL environment, which has the `context` variable, and querying sub-LLMs by writing to ```repl``` tags, and determine your answer. Your next action:"""
@@ -5,6 +5,7 @@ Uses tiktoken for OpenAI-style models when available; otherwise estimates
 with ~4 characters per token.
 """
 
+import functools
 import importlib
 from typing import Any, cast
 
@@ -90,22 +91,32 @@ def get_context_limit(model_name: str) -> int:
     return best_limit
 
 
-def _count_tokens_tiktoken(messages: list[dict[str, Any]], model_name: str) -> int | None:
-    """Count tokens with tiktoken if available. Returns None on failure."""
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model_name: str) -> Any | None:
+    """Return the tiktoken encoding for a model, or None if tiktoken is unavailable.
+
+    Cached per model name: building an encoding loads its BPE ranks, which is far
+    more expensive than encoding a message.
+    """
     try:
-        tiktoken_module = importlib.import_module("tiktoken")
+        tiktoken = importlib.import_module("tiktoken")
     except ImportError:
         return None
 
-    tiktoken = tiktoken_module
     try:
-        enc = tiktoken.encoding_for_model(model_name)
+        return tiktoken.encoding_for_model(model_name)
     except Exception:
         try:
-            enc = tiktoken.get_encoding("cl100k_base")
+            return tiktoken.get_encoding("cl100k_base")
         except Exception:
             return None
 
+
+def _count_tokens_tiktoken(messages: list[dict[str, Any]], model_name: str) -> int | None:
+    """Count tokens with tiktoken if available. Returns None on failure."""
+    enc = _get_encoding(model_name)
+    if enc is None:
+        return None
     return _tokens_for_messages(enc, messages)
 
 
@@ -158,9 +169,100 @@ def count_tokens(messages: list[dict[str, Any]], model_name: str) -> int:
         n = _count_tokens_tiktoken(messages, model_name)
         if n is not None:
             return n
-    # Fallback: count chars (stringify in case content is not str, e.g. list)
+    return _estimate_from_chars(_content_chars(messages))
+
+
+def _content_chars(messages: list[dict[str, Any]]) -> int:
+    # Stringify in case content is not str, e.g. list
     total_chars = 0
     for m in messages:
         raw = m.get("content", "") or ""
         total_chars += len(raw) if isinstance(raw, str) else len(str(raw))
+    return total_chars
+
+
+def _estimate_from_chars(total_chars: int) -> int:
     return (total_chars + CHARS_PER_TOKEN_ESTIMATE - 1) // CHARS_PER_TOKEN_ESTIMATE
+
+
+def _max_tokens_for_messages(messages: list[dict[str, Any]]) -> int:
+    """Upper bound on _tokens_for_messages() that never runs a tokenizer.
+
+    Byte-level BPE emits at most one token per UTF-8 byte, and a character takes at
+    most four bytes. str.isascii() is O(1) in CPython, so the bound costs one len()
+    per message.
+    """
+    total = 0
+    for m in messages:
+        # tokens_per_message + tokens_per_name
+        total += 4
+        raw = m.get("content", "") or ""
+        text = raw if isinstance(raw, str) else str(raw)
+        total += len(text) if text.isascii() else 4 * len(text)
+    return total
+
+
+class IncrementalTokenCounter:
+    """
+    Running token count for an append-only message history.
+
+    Each message is tokenized once: count() only processes messages appended since
+    the previous call on the same list, and starts over when handed a different list
+    (e.g. after compaction) or a shorter one. Results equal count_tokens().
+    upper_bound() and estimate() never tokenize, so callers can defer count() until
+    the history could actually be large.
+    """
+
+    def __init__(self, model_name: str) -> None:
+        self.model_name = model_name
+        self.context_limit = get_context_limit(model_name)
+        self._use_tokenizer = bool(model_name) and model_name != "unknown"
+        self._messages: list[dict[str, Any]] | None = None
+        self._scanned = 0
+        self._chars = 0
+        self._bound = 0
+        self._counted = 0
+        self._tokens: int | None = 0
+
+    def count(self, messages: list[dict[str, Any]]) -> int:
+        self._scan(messages)
+        if self._tokens is not None:
+            new_messages = messages[self._counted :]
+            if new_messages:
+                self._counted = len(messages)
+                new_tokens = _count_tokens_tiktoken(new_messages, self.model_name)
+                self._tokens = None if new_tokens is None else self._tokens + new_tokens
+
+        if not messages:
+            return 0
+        if self._tokens is not None:
+            return self._tokens
+        return _estimate_from_chars(self._chars)
+
+    def upper_bound(self, messages: list[dict[str, Any]]) -> int:
+        """Return a value count(messages) is guaranteed not to exceed."""
+        self._scan(messages)
+        if not self._use_tokenizer:
+            return _estimate_from_chars(self._chars)
+        return self._bound
+
+    def estimate(self, messages: list[dict[str, Any]]) -> int:
+        """Return the character-based estimate count_tokens() falls back to."""
+        self._scan(messages)
+        return _estimate_from_chars(self._chars)
+
+    def _scan(self, messages: list[dict[str, Any]]) -> None:
+        if messages is not self._messages or len(messages) < self._scanned:
+            self._messages = messages
+            self._scanned = 0
+            self._chars = 0
+            self._bound = 0
+            self._counted = 0
+            self._tokens = 0 if self._use_tokenizer else None
+
+        new_messages = messages[self._scanned :]
+        if new_messages:
+            self._scanned = len(messages)
+            self._chars += _content_chars(new_messages)
+            if self._use_tokenizer:
+                self._bound += _max_tokens_for_messages(new_messages)
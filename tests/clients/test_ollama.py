@@ -11,7 +11,7 @@ class TestOllamaClientUnit:
 
     def test_get_usage_summary_after_completion(self) -> None:
         """Usage summary should expose tracked totals using ModelUsageSummary fields."""
-        with patch("rlm.clients.ollama.requests.post") as mock_post:
+        with patch("rlm.clients.ollama.requests.Session.post") as mock_post:
             mock_post.return_value.raise_for_status.return_value = None
             mock_post.return_value.json.return_value = {
                 "response": "hello",
@@ -29,3 +29,16 @@ class TestOllamaClientUnit:
             assert usage.total_calls > 0
             assert usage.total_input_tokens > 0
             assert usage.total_output_tokens > 0
+
+    def test_requests_share_one_session(self) -> None:
+        """Repeated completions should reuse the client's pooled session."""
+        client = OllamaClient(model_name="llama3")
+        with patch.object(client.session, "post") as mock_post:
+            mock_post.return_value.raise_for_status.return_value = None
+            mock_post.return_value.json.return_value = {"response": "ok"}
+
+            client.completion("one")
+            client.completion("two")
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.args == (f"{client.base_url}/api/generate",)
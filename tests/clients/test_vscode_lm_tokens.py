@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import threading
 from typing import Any
 
@@ -36,3 +37,34 @@ def test_vscode_lm_tracks_tokens_from_bridge_payload() -> None:
     assert result == "ok"
     assert summary.total_input_tokens == 12
     assert summary.total_output_tokens == 7
+
+
+def test_vscode_lm_acompletion_does_not_block_event_loop() -> None:
+    pending: dict[str, tuple[threading.Event, dict[str, Any]]] = {}
+    release = threading.Event()
+
+    def send_fn(payload: dict[str, Any]) -> None:
+        event, container = pending[str(payload["nonce"])]
+
+        def reply() -> None:
+            if payload["prompt"] == "slow":
+                release.wait(timeout=5)
+            container["text"] = str(payload["prompt"])
+            event.set()
+
+        threading.Thread(target=reply, daemon=True).start()
+
+    def register_response_fn(nonce: str, event: threading.Event, container: dict[str, Any]) -> None:
+        pending[nonce] = (event, container)
+
+    client = VsCodeLM(send_fn=send_fn, register_response_fn=register_response_fn)
+
+    async def run() -> list[str]:
+        slow = asyncio.create_task(client.acompletion("slow"))
+        fast = await asyncio.create_task(client.acompletion("fast"))
+        # A blocking acompletion would have held the loop until "slow" finished.
+        assert not slow.done()
+        release.set()
+        return [fast, await slow]
+
+    assert asyncio.run(run()) == ["fast", "slow"]
@@ -1,10 +1,12 @@
 import json
 import socket
 import struct
-from typing import Any
+import threading
+from typing import Any, cast
 
 import pytest
 
+from rlm.core import comms_utils
 from rlm.core.comms_utils import (
     LMRequest,
     LMResponse,
@@ -13,7 +15,9 @@ from rlm.core.comms_utils import (
     socket_recv,
     socket_send,
 )
+from rlm.core.lm_handler import LMHandler
 from rlm.core.types import ModelUsageSummary, RLMChatCompletion, UsageSummary
+from tests.mock_lm import MockLM
 
 
 def _make_completion(response: str) -> RLMChatCompletion:
@@ -128,6 +132,68 @@ class TestSocketWireFormat:
 
         assert restored == payload
 
+    @pytest.mark.parametrize("first_write", [2, 10])
+    def test_socket_send_completes_partial_sendmsg(self, first_write: int) -> None:
+        class _PartialSocket:
+            def __init__(self) -> None:
+                self.buffer = b""
+
+            def sendmsg(self, buffers: list[bytes]) -> int:
+                self.buffer += b"".join(buffers)[:first_write]
+                return first_write
+
+            def sendall(self, data: bytes | memoryview) -> None:
+                self.buffer += bytes(data)
+
+        payload: dict[str, Any] = {"message": "hello world"}
+        sock = _PartialSocket()
+        socket_send(cast(socket.socket, sock), payload)
+
+        message_length = struct.unpack(">I", sock.buffer[:4])[0]
+        assert message_length == len(sock.buffer) - 4
+        assert json.loads(sock.buffer[4:]) == payload
+
+    def test_socket_send_falls_back_to_stdlib_json_without_orjson(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("rlm.core.comms_utils._orjson_module", None)
+        payload: dict[str, Any] = {"message": "héllo"}
+        sender, receiver = socket.socketpair()
+        try:
+            socket_send(sender, payload)
+            restored = socket_recv(receiver)
+        finally:
+            sender.close()
+            receiver.close()
+
+        assert restored == payload
+
+    def test_socket_send_accepts_non_string_keys(self) -> None:
+        sender, receiver = socket.socketpair()
+        try:
+            socket_send(sender, {"counts": {1: "one"}})
+            restored = socket_recv(receiver)
+        finally:
+            sender.close()
+            receiver.close()
+
+        assert restored == {"counts": {"1": "one"}}
+
+    def test_socket_recv_handles_header_split_across_packets(self) -> None:
+        payload: dict[str, Any] = {"status": "ok"}
+        encoded = json.dumps(payload).encode("utf-8")
+        framed = struct.pack(">I", len(encoded)) + encoded
+        sender, receiver = socket.socketpair()
+        try:
+            sender.sendall(framed[:2])
+            sender.sendall(framed[2:])
+            restored = socket_recv(receiver)
+        finally:
+            sender.close()
+            receiver.close()
+
+        assert restored == payload
+
     def test_socket_recv_returns_empty_dict_on_closed_connection(self) -> None:
         sender, receiver = socket.socketpair()
         sender.close()
@@ -193,6 +259,7 @@ class TestSocketWireFormat:
         assert all(response.error is not None for response in responses)
         assert all("Request failed" in str(response.error) for response in responses)
         assert all("connection refused" in str(response.error) for response in responses)
+        assert responses[0] is not responses[1]
 
     def test_send_lm_request_batched_success(self, monkeypatch: pytest.MonkeyPatch) -> None:
         calls: list[dict[str, Any]] = []
@@ -230,3 +297,130 @@ class TestSocketWireFormat:
         assert responses[1].chat_completion is not None
         assert responses[0].chat_completion.response == "one"
         assert responses[1].chat_completion.response == "two"
+
+
+class TestKeepAliveConnections:
+    def test_handler_serves_multiple_frames_per_connection(self) -> None:
+        with LMHandler(MockLM()) as handler:
+            with socket.create_connection(handler.address, timeout=5) as sock:
+                for prompt in ("first", "second"):
+                    socket_send(sock, LMRequest(prompt=prompt).to_dict())
+                    response = LMResponse.from_dict(socket_recv(sock))
+                    assert response.chat_completion is not None
+                    assert prompt in response.chat_completion.response
+
+    def test_send_lm_request_reuses_pooled_connection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pool = comms_utils._ConnectionPool()
+        monkeypatch.setattr(comms_utils, "_connection_pool", pool)
+        connects: list[tuple[str, int]] = []
+        real_connect = comms_utils._connect
+
+        def _counting_connect(address: tuple[str, int], timeout: int) -> socket.socket:
+            connects.append(address)
+            return real_connect(address, timeout)
+
+        monkeypatch.setattr(comms_utils, "_connect", _counting_connect)
+
+        with LMHandler(MockLM()) as handler:
+            address = handler.address
+            for _ in range(3):
+                assert send_lm_request(address, LMRequest(prompt="hi")).success
+
+        assert connects == [address]
+        pool.clear()
+
+    def test_stale_pooled_connection_falls_back_to_new_connection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pool = comms_utils._ConnectionPool()
+        monkeypatch.setattr(comms_utils, "_connection_pool", pool)
+
+        with LMHandler(MockLM()) as first:
+            address = first.address
+            assert send_lm_request(address, LMRequest(prompt="hi")).success
+
+        # The stopped handler closed the pooled connection; a new handler on the
+        # same port must be reached over a fresh one.
+        with LMHandler(MockLM(), port=address[1]) as second:
+            assert send_lm_request(second.address, LMRequest(prompt="again")).success
+        pool.clear()
+
+    def test_handler_stop_discards_pooled_connections(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pool = comms_utils._ConnectionPool()
+        monkeypatch.setattr(comms_utils, "_connection_pool", pool)
+
+        with LMHandler(MockLM()) as handler:
+            address = handler.address
+            assert send_lm_request(address, LMRequest(prompt="hi")).success
+            assert address in pool._idle
+
+        assert address not in pool._idle
+
+    def test_pool_evicts_least_recently_used_address(self) -> None:
+        pool = comms_utils._ConnectionPool(max_addresses=2)
+        pairs = [socket.socketpair() for _ in range(3)]
+        addresses = [("127.0.0.1", port) for port in (1001, 1002, 1003)]
+
+        pool.release(addresses[0], pairs[0][0])
+        pool.release(addresses[1], pairs[1][0])
+        pool.release(addresses[2], pairs[2][0])
+
+        assert list(pool._idle) == addresses[1:]
+        assert pairs[0][0].fileno() == -1
+        pool.clear()
+        for _, peer in pairs:
+            peer.close()
+
+    def test_closed_idle_connection_is_skipped_before_sending(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pool = comms_utils._ConnectionPool()
+        monkeypatch.setattr(comms_utils, "_connection_pool", pool)
+
+        with LMHandler(MockLM()) as handler:
+            stale, peer = socket.socketpair()
+            peer.close()
+            pool.release(handler.address, stale)
+
+            assert send_lm_request(handler.address, LMRequest(prompt="hi")).success
+            assert stale.fileno() == -1
+        pool.clear()
+
+    def test_response_dropped_mid_frame_is_not_resent(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pool = comms_utils._ConnectionPool()
+        monkeypatch.setattr(comms_utils, "_connection_pool", pool)
+        requests_seen: list[dict[str, Any]] = []
+
+        def serve(listener: socket.socket) -> None:
+            # First connection: answer one request, then cut the second reply short.
+            # Any later connection would be a resend; answer it fully.
+            while True:
+                try:
+                    conn, _ = listener.accept()
+                except OSError:
+                    return
+                with conn:
+                    while request := socket_recv(conn):
+                        requests_seen.append(request)
+                        if len(requests_seen) == 2:
+                            conn.sendall(struct.pack(">I", 100) + b'{"ok"')
+                            break
+                        socket_send(conn, {"ok": True})
+
+        with socket.create_server(("127.0.0.1", 0)) as listener:
+            server = threading.Thread(target=serve, args=(listener,), daemon=True)
+            server.start()
+            address = listener.getsockname()[:2]
+
+            assert comms_utils.socket_request(address, {"n": 1}, timeout=5) == {"ok": True}
+            with pytest.raises(ConnectionError):
+                comms_utils.socket_request(address, {"n": 2}, timeout=5)
+
+        assert requests_seen == [{"n": 1}, {"n": 2}]
+        pool.clear()
@@ -15,6 +15,7 @@ from rlm import RLM
 from rlm.core.rlm import RLMConfig
 from rlm.core.types import ModelUsageSummary, UsageSummary
 from rlm.environments.local_repl import LocalREPL
+from rlm.utils.token_utils import IncrementalTokenCounter
 
 
 def _mock_usage() -> UsageSummary:
@@ -137,6 +138,23 @@ class TestAppendCompactionEntry:
         repl.cleanup()
 
 
+class TestEnvCaps:
+    """Test the per-completion environment capability probe."""
+
+    def test_local_repl_supports_compaction_and_persistence(self) -> None:
+        env = LocalREPL()
+        try:
+            caps = rlm_module._EnvCaps.probe(env)
+            assert caps.supports_compaction is True
+            assert caps.supports_persistence is True
+        finally:
+            env.cleanup()
+
+    def test_minimal_environment_supports_neither(self) -> None:
+        caps = rlm_module._EnvCaps.probe(cast(Any, object()))
+        assert caps == rlm_module._EnvCaps(supports_compaction=False, supports_persistence=False)
+
+
 class TestGetCompactionStatus:
     """Test the _get_compaction_status method."""
 
@@ -166,6 +184,25 @@ class TestGetCompactionStatus:
             # Current tokens for these short messages should be much less than threshold
             assert current < threshold
 
+    def test_counter_skips_tokenizer_below_threshold(self) -> None:
+        rlm = RLM(
+            RLMConfig(backend="openai", backend_kwargs={"model_name": "gpt-4o"}, compaction=True)
+        )
+        counter = IncrementalTokenCounter("gpt-4o")
+        messages = [{"role": "user", "content": "x" * 400}]
+
+        with patch("rlm.utils.token_utils._count_tokens_tiktoken") as tokenize:
+            current, threshold, _ = cast(Any, rlm)._get_compaction_status(messages, counter)
+            tokenize.assert_not_called()
+        assert current == 100
+        assert threshold == int(0.85 * 128_000)
+
+        big = [{"role": "user", "content": "x" * threshold}]
+        with patch("rlm.utils.token_utils._count_tokens_tiktoken", return_value=5) as tokenize:
+            current, _, _ = cast(Any, rlm)._get_compaction_status(big, counter)
+            tokenize.assert_called_once()
+        assert current == 5
+
 
 class TestCompactionInLoop:
     """Integration-level compaction trigger check in the RLM loop."""
@@ -2,7 +2,7 @@ from collections.abc import Callable
 from typing import Any
 
 from rlm.clients.base_lm import BaseLM
-from rlm.core.lm_handler import LMHandler
+from rlm.core.lm_handler import CLIENT_CACHE_SIZE, LMHandler, _freeze_preferences
 from rlm.core.types import ModelUsageSummary, UsageSummary
 
 
@@ -72,6 +72,43 @@ def test_get_client_uses_model_preferences_family_match() -> None:
     assert selected.model_name == "anthropic/claude-3-5-sonnet"
 
 
+def test_get_client_cache_invalidated_by_register_client() -> None:
+    root_client = DummyLM("root-model")
+    handler = LMHandler(root_client)
+    preferences = {"candidates": ["gpt-4o-mini"]}
+
+    assert handler.get_client(model_preferences=preferences) is root_client
+
+    preferred_client = DummyLM("gpt-4o-mini")
+    handler.register_client(preferred_client.model_name, preferred_client)
+
+    assert handler.get_client(model_preferences=preferences) is preferred_client
+
+
+def test_get_usage_summary_queries_each_client_once() -> None:
+    root_client = DummyLM("root-model")
+    sub_client = DummyLM("sub-model")
+    handler = LMHandler(root_client, other_backend_client=sub_client)
+    handler.register_client(sub_client.model_name, sub_client)
+    calls: list[str] = []
+
+    for client in (root_client, sub_client):
+        real_summary = client.get_usage_summary
+
+        def _counting_summary(
+            client: BaseLM = client, real_summary: Callable[[], UsageSummary] = real_summary
+        ) -> UsageSummary:
+            calls.append(client.model_name)
+            return real_summary()
+
+        client.get_usage_summary = _counting_summary  # type: ignore[method-assign]
+
+    summary = handler.get_usage_summary()
+
+    assert sorted(calls) == ["root-model", "sub-model"]
+    assert set(summary.model_usage_summaries) == {"root-model", "sub-model"}
+
+
 def test_direct_completion_streams_chunks_when_callback_provided() -> None:
     root_client = DummyLM("root-model")
     handler = LMHandler(root_client)
@@ -81,3 +118,30 @@ def test_direct_completion_streams_chunks_when_callback_provided() -> None:
 
     assert result == "root-model:hello"
     assert emitted == ["root-model:", "hello"]
+
+
+def test_freeze_preferences_keeps_key_types_and_container_kinds_apart() -> None:
+    assert _freeze_preferences({1: "x"}) != _freeze_preferences({"1": "x"})
+    assert _freeze_preferences({"a": 1}) != _freeze_preferences([["a", 1]])
+    assert _freeze_preferences({"a": 1, "b": 2}) == _freeze_preferences({"b": 2, "a": 1})
+
+
+def test_get_client_cache_separates_list_and_tuple_candidates() -> None:
+    root_client = DummyLM("root-model")
+    preferred_client = DummyLM("gpt-4o-mini")
+    handler = LMHandler(root_client)
+    handler.register_client(preferred_client.model_name, preferred_client)
+
+    # Only list candidates are honored; a tuple must not reuse the list's entry.
+    assert handler.get_client(model_preferences={"candidates": ["gpt-4o-mini"]}) is preferred_client
+    assert handler.get_client(model_preferences={"candidates": ("gpt-4o-mini",)}) is root_client
+
+
+def test_get_client_cache_is_bounded() -> None:
+    root_client = DummyLM("root-model")
+    handler = LMHandler(root_client)
+
+    for i in range(CLIENT_CACHE_SIZE + 50):
+        assert handler.get_client(model=f"unknown-{i}") is root_client
+
+    assert len(handler._client_cache) == CLIENT_CACHE_SIZE
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 from rlm.core.types import CodeBlock, REPLResult, RLMIteration
 from rlm.environments.local_repl import LocalREPL
 from rlm.utils.parsing import (
+    FenceScanner,
     convert_context_for_repl,
     find_code_blocks,
     find_final_answer,
@@ -78,6 +79,32 @@ print(result)
         assert "return n * factorial(n - 1)" in blocks[0]
 
 
+class TestFenceScanner:
+    """Tests for incremental code-block extraction from streamed chunks."""
+
+    RESPONSE = (
+        "Plan first.\n```repl\nx = 1\n```\nThen a plain fence:\n```python\nignored\n```\n"
+        "```repl   \n\nprint(x)\n```\nTrailing text ``` with a stray fence."
+    )
+
+    def test_matches_find_code_blocks_for_every_chunk_size(self):
+        expected = find_code_blocks(self.RESPONSE)
+        assert expected == ["x = 1", "print(x)"]
+        for size in range(1, len(self.RESPONSE) + 1):
+            scanner = FenceScanner()
+            for start in range(0, len(self.RESPONSE), size):
+                scanner.feed(self.RESPONSE[start : start + size])
+            assert scanner.blocks == expected, size
+            assert scanner.length == len(self.RESPONSE)
+
+    def test_feed_returns_newly_completed_blocks(self):
+        scanner = FenceScanner()
+        assert scanner.feed("```repl\na = 1\n``") == []
+        assert scanner.feed("`\n```repl\nb = 2") == ["a = 1"]
+        assert scanner.feed("\n```") == ["b = 2"]
+        assert scanner.blocks == ["a = 1", "b = 2"]
+
+
 class TestFindFinalAnswer:
     """Tests for find_final_answer function."""
 
@@ -316,6 +343,15 @@ FINAL(42)
         finally:
             env.cleanup()
 
+    def test_response_without_marker_only_consults_environment(self):
+        env = Mock()
+        env.consume_final_answer.return_value = "done"
+
+        result = find_final_answer("```repl\nx = 1\n```\nStill working.", environment=env)
+
+        assert result == "done"
+        env.execute_code.assert_not_called()
+
     def test_final_callable_survives_user_overwrite(self):
         """RF-097: FINAL is in RESERVED_TOOL_NAMES, so user code cannot permanently overwrite it."""
         from rlm.environments.base_env import RESERVED_TOOL_NAMES
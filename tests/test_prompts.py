@@ -1,3 +1,4 @@
+from rlm.core.rlm import RLM, RLMConfig
 from rlm.core.types import QueryMetadata
 from rlm.utils.prompts import RLM_SYSTEM_PROMPT, build_rlm_system_prompt, build_user_prompt
 
@@ -51,6 +52,22 @@ def test_custom_tools_empty_dict_no_section() -> None:
     assert "Additional custom tools" not in messages[0]["content"]
 
 
+def test_rlm_setup_prompt_matches_build_rlm_system_prompt() -> None:
+    tools = {"fetch_docs": "Fetch docs"}
+    rlm = RLM(RLMConfig(backend="openai", custom_tools=tools, compaction=True))
+    context = ["chunk one", "chunk two"]
+
+    expected = build_rlm_system_prompt(
+        system_prompt=RLM_SYSTEM_PROMPT,
+        query_metadata=QueryMetadata(context),
+        custom_tools=tools,
+        compaction=True,
+    )
+
+    assert rlm._setup_prompt(context) == expected
+    assert rlm._setup_prompt("other")[0] == expected[0]
+
+
 def test_build_user_prompt_iteration_zero_single_context_no_history() -> None:
     message = build_user_prompt(root_prompt="Q", iteration=0, context_count=1, history_count=0)
     content = message["content"]
@@ -211,3 +211,28 @@ class TestLocalREPLRecursiveSubcallHook:
         assert response == "nested response"
         assert called_prompts == ["hello from repl"]
         assert len(repl.pending_llm_calls) == 1
+
+    def test_local_repl_recursive_config_is_isolated_from_parent(self) -> None:
+        rlm = RLM(
+            RLMConfig(
+                backend="openai",
+                backend_kwargs={"model_name": "parent-model"},
+                other_backends=["openai"],
+                other_backend_kwargs=[{"model_name": "sub-model"}],
+                enable_recursive_subcalls=True,
+            )
+        )
+        lm_handler = Mock(host="127.0.0.1", port=0)
+
+        repl = rlm._create_environment(lm_handler, "context")
+        try:
+            assert isinstance(repl, LocalREPL)
+            config = repl.recursive_rlm_config
+            assert config is not None
+            config["backend_kwargs"]["model_name"] = "mutated"
+            config["other_backend_kwargs"][0]["model_name"] = "mutated"
+        finally:
+            repl.cleanup()
+
+        assert rlm.backend_kwargs == {"model_name": "parent-model"}
+        assert rlm.other_backend_kwargs == [{"model_name": "sub-model"}]
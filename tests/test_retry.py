@@ -69,3 +69,45 @@ class TestRetryWithBackoff:
 
         delays = [call.args[0] for call in sleep_mock.call_args_list]
         assert delays == [1.0, 2.0, 2.0]
+
+    def test_full_jitter_sleeps_within_backoff_window(self) -> None:
+        calls = {"count": 0}
+
+        def flaky() -> str:
+            calls["count"] += 1
+            if calls["count"] < 3:
+                raise ConnectionError("temporary")
+            return "done"
+
+        with (
+            patch("rlm.core.retry.time.sleep") as sleep_mock,
+            patch("rlm.core.retry.random.uniform", side_effect=lambda a, b: b / 2) as uniform,
+        ):
+            result = retry_with_backoff(flaky, initial_delay=1.0, max_delay=1.5, jitter=True)
+
+        assert result == "done"
+        assert [call.args for call in uniform.call_args_list] == [(0, 1.0), (0, 1.5)]
+        assert [call.args[0] for call in sleep_mock.call_args_list] == [0.5, 0.75]
+
+    def test_retry_after_overrides_backoff(self) -> None:
+        class ThrottledError(ConnectionError):
+            def __init__(self, retry_after: float) -> None:
+                super().__init__("throttled")
+                self.retry_after = retry_after
+
+        calls = {"count": 0}
+
+        def throttled() -> str:
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise ThrottledError(3.0)
+            if calls["count"] == 2:
+                raise ThrottledError(120.0)
+            return "done"
+
+        with patch("rlm.core.retry.time.sleep") as sleep_mock:
+            result = retry_with_backoff(throttled, initial_delay=0.1, max_delay=10.0, jitter=True)
+
+        assert result == "done"
+        assert [call.args[0] for call in sleep_mock.call_args_list] == [3.0, 10.0]
+
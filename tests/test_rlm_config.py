@@ -58,9 +58,13 @@ class TestRLMConfigConstructor:
 
         assert rlm.backend == "openai"
         assert rlm.backend_kwargs == {"model_name": "gpt-4o-mini"}
+        assert rlm.root_model == "gpt-4o-mini"
         assert rlm.max_iterations == 12
         assert rlm.compaction is True
 
+    def test_root_model_defaults_to_unknown(self) -> None:
+        assert RLM(RLMConfig(backend="openai")).root_model == "unknown"
+
     def test_rejects_additional_init_args(self) -> None:
         config = RLMConfig(backend="openai")
 
@@ -147,3 +151,120 @@ class TestRLMConfigConstructor:
             assert lm_handler.get_client(model="unknown").model_name == "root-model"
         finally:
             lm_handler.stop()
+
+
+class TestPrefixPromptCache:
+    def _rlm(self) -> Any:
+        return cast(Any, RLM(RLMConfig(backend="openai", enable_prefix_cache=True)))
+
+    def test_histories_sharing_last_message_do_not_collide(self) -> None:
+        rlm = self._rlm()
+        shared_last = {"role": "user", "content": "same tail"}
+        first = [{"role": "system", "content": "alpha"}, shared_last]
+        second = [{"role": "system", "content": "beta"}, shared_last]
+
+        prompt_a = rlm._cached_prompt(first, None, 0, 1, 0)
+        prompt_b = rlm._cached_prompt(second, None, 0, 1, 0)
+
+        assert prompt_a[0]["content"] == "alpha"
+        assert prompt_b[0]["content"] == "beta"
+        assert len(rlm._prefix_prompt_cache) == 2
+
+    def test_evicts_least_recently_used_prefix(self) -> None:
+        rlm = self._rlm()
+        histories = [[{"role": "user", "content": f"h{i}"}] for i in range(3)]
+
+        with patch.object(rlm_module, "_PREFIX_CACHE_MAX_ENTRIES", 2):
+            rlm._cached_prompt(histories[0], None, 0, 1, 0)
+            rlm._cached_prompt(histories[1], None, 0, 1, 0)
+            rlm._cached_prompt(histories[0], None, 0, 1, 0)  # refresh h0
+            rlm._cached_prompt(histories[2], None, 0, 1, 0)
+
+        cached = [prefix[0]["content"] for prefix in rlm._prefix_prompt_cache.values()]
+        assert cached == ["h0", "h2"]
+
+    def test_stats_count_hits_misses_and_evictions(self) -> None:
+        rlm = self._rlm()
+        history = [{"role": "user", "content": "h"}]
+
+        with patch.object(rlm_module, "_PREFIX_CACHE_MAX_ENTRIES", 1):
+            rlm._cached_prompt(history, None, 0, 1, 0)
+            rlm._cached_prompt(history, None, 1, 1, 0)
+            rlm._cached_prompt([*history, {"role": "assistant", "content": "a"}], None, 2, 1, 0)
+            stats = rlm.get_prefix_cache_stats()
+
+        assert stats["enabled"] is True
+        assert (stats["size"], stats["max_size"]) == (1, 1)
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+
+    def test_rolling_hash_matches_full_rehash(self) -> None:
+        history = [{"role": "system", "content": "s"}, {"role": "user", "content": "u"}]
+        extra = [{"role": "assistant", "content": "a"}]
+
+        rolled = rlm_module._fold_prefix_hash(rlm_module._fold_prefix_hash(0, history), extra)
+
+        assert rolled == rlm_module._fold_prefix_hash(0, history + extra)
+
+
+class TestStreamedCompletionTurn:
+    def test_streamed_chunks_feed_code_block_parsing(self) -> None:
+        response = "Run this:\n```repl\nx = 1\n```\ndone"
+        chunks: list[str] = []
+        rlm = RLM(RLMConfig(backend="openai", on_root_chunk=chunks.append))
+
+        def stream(prompt: Any, on_chunk: Callable[[str], None]) -> str:
+            _ = prompt
+            for start in range(0, len(response), 5):
+                on_chunk(response[start : start + 5])
+            return response
+
+        lm_handler = Mock()
+        lm_handler.completion.side_effect = stream
+        environment = Mock()
+
+        with patch.object(rlm_module, "find_code_blocks") as find_code_blocks:
+            iteration = rlm.completion_turn("prompt", lm_handler, environment)
+
+        find_code_blocks.assert_not_called()
+        assert "".join(chunks) == response
+        environment.execute_code.assert_called_once_with("x = 1")
+        assert [block.code for block in iteration.code_blocks] == ["x = 1"]
+
+
+class CountingLM(DummyLM):
+    def __init__(self, model_name: str) -> None:
+        super().__init__(model_name=model_name)
+        self.calls = 0
+
+    def completion(self, prompt: str | list[dict[str, Any]]) -> str:
+        self.calls += 1
+        return super().completion(prompt)
+
+    def get_usage_summary(self) -> UsageSummary:
+        return UsageSummary(
+            model_usage_summaries={
+                self.model_name: ModelUsageSummary(
+                    total_calls=self.calls,
+                    total_input_tokens=10 * self.calls,
+                    total_output_tokens=5 * self.calls,
+                )
+            }
+        )
+
+
+class TestFallbackClientReuse:
+    def test_fallback_reuses_client_and_reports_per_call_usage(self) -> None:
+        client = CountingLM("leaf-model")
+        rlm = RLM(
+            RLMConfig(backend="openai", backend_kwargs={"model_name": "leaf-model"}, max_depth=0)
+        )
+
+        with patch.object(rlm_module, "get_client", return_value=client) as get_client:
+            first = rlm.completion("one")
+            second = rlm.completion("two")
+
+        get_client.assert_called_once()
+        assert second.response == "leaf-model:two"
+        for result in (first, second):
+            usage = result.usage_summary.model_usage_summaries["leaf-model"]
+            assert (usage.total_calls, usage.total_input_tokens) == (1, 10)
@@ -1,14 +1,24 @@
 """Tests for AST sandbox validation."""
 
+import sys
+from unittest.mock import patch
+
 import pytest
 
+from rlm.core.sandbox import ast_validator
 from rlm.core.sandbox.ast_validator import (
     BLOCKED_FUNCTIONS,
     BLOCKED_MODULES,
     ASTValidationError,
     validate_ast,
 )
-from rlm.core.sandbox.safe_builtins import get_safe_builtins
+from rlm.core.sandbox.restricted_exec import (
+    BlockedModule,
+    create_restricted_environment,
+    restore_sys_modules,
+    setup_runtime_blocking,
+)
+from rlm.core.sandbox.safe_builtins import SAFE_BUILTINS, get_safe_builtins
 
 
 class TestAstValidator:
@@ -58,6 +68,51 @@ class TestAstValidator:
         with pytest.raises(ASTValidationError, match="Invalid Python syntax"):
             validate_ast("def broken(")
 
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "y = 1 + eval('2')",
+            "items = [x for x in range(3) if exec('pass')]",
+            "def outer():\n    def inner():\n        import os",
+            "handler = lambda: __builtins__['exec']",
+        ],
+    )
+    def test_blocks_constructs_nested_in_expressions(self, code: str) -> None:
+        with pytest.raises(ASTValidationError, match="Blocked"):
+            validate_ast(code)
+
+    def test_blank_code_skips_parsing(self) -> None:
+        with patch.object(ast_validator, "_validation_error") as validation_error:
+            for code in ("", "   ", "\n\t\n"):
+                validate_ast(code)
+        validation_error.assert_not_called()
+
+    def test_unicode_whitespace_is_still_parsed(self) -> None:
+        with pytest.raises(ASTValidationError, match="Invalid Python syntax"):
+            validate_ast("\u00a0")
+
+    def test_allows_long_expression_chains(self) -> None:
+        validate_ast("total = " + " + ".join(["1"] * 2000))
+
+    def test_clean_code_skips_tree_walk(self) -> None:
+        with patch.object(ast_validator, "_find_blocked_construct") as walk:
+            validate_ast("import math\nposition = math.cos(0)  # execute later")
+        walk.assert_not_called()
+
+    def test_non_ascii_identifiers_are_still_walked(self) -> None:
+        # NFKC normalization turns the fullwidth spelling into eval.
+        with pytest.raises(ASTValidationError, match="Blocked function call"):
+            validate_ast("\uff45\uff56\uff41\uff4c('1')")
+
+    def test_repeated_code_is_validated_once(self) -> None:
+        ast_validator._validation_error.cache_clear()
+        with patch.object(ast_validator, "compile", wraps=compile, create=True) as parse:
+            for _ in range(3):
+                validate_ast("total = sum(range(10))")
+                with pytest.raises(ASTValidationError, match="Blocked import"):
+                    validate_ast("import socket")
+        assert parse.call_count == 2
+
     @pytest.mark.parametrize("module_name", sorted(BLOCKED_MODULES))
     def test_blocks_all_blocked_modules(self, module_name: str) -> None:
         with pytest.raises(ASTValidationError, match="Blocked import"):
@@ -82,3 +137,63 @@ def test_strict_builtins_block_runtime_input() -> None:
     strict_builtins = get_safe_builtins()
     with pytest.raises(TypeError):
         exec("input('prompt')", {"__builtins__": strict_builtins}, {})
+
+
+def test_get_safe_builtins_returns_independent_copies() -> None:
+    first = get_safe_builtins()
+    first["open"] = open
+
+    assert get_safe_builtins()["open"] is None
+    assert SAFE_BUILTINS["open"] is None
+    with pytest.raises(TypeError):
+        SAFE_BUILTINS["open"] = open  # type: ignore[index]
+
+
+class TestRestrictedEnvironment:
+    """Coverage for the globals built for strict sandbox execution."""
+
+    def test_safe_builtins_resolve_and_blocked_names_do_not(self) -> None:
+        restricted_globals, restricted_locals = create_restricted_environment()
+
+        exec("result = sorted(map(abs, [-2, 1]))", restricted_globals, restricted_locals)
+        assert restricted_locals["result"] == [1, 2]
+        for code in ("eval('1')", "open('x')", "input()"):
+            with pytest.raises(NameError):
+                exec(code, restricted_globals, restricted_locals)
+
+    def test_import_statements_are_refused(self) -> None:
+        restricted_globals, restricted_locals = create_restricted_environment()
+
+        with pytest.raises(ImportError, match="not allowed"):
+            exec("import math", restricted_globals, restricted_locals)
+        with pytest.raises(ImportError, match="blocked"):
+            exec("import socket", restricted_globals, restricted_locals)
+
+    def test_blocked_prefixes_match_whole_module_names(self) -> None:
+        restricted_globals, restricted_locals = create_restricted_environment()
+        safe_import = restricted_globals["__builtins__"]["__import__"]
+
+        with pytest.raises(ImportError, match="blocked"):
+            safe_import("os.path")
+        with pytest.raises(ImportError, match="not allowed"):
+            safe_import("httpx_client")
+
+
+def test_runtime_blocking_round_trips_sys_modules() -> None:
+    original_os = sys.modules["os"]
+    had_socket = "socket" in sys.modules
+
+    original_modules = setup_runtime_blocking()
+    try:
+        assert isinstance(sys.modules["os"], BlockedModule)
+        assert sys.modules["socket"] is sys.modules["os"]
+    finally:
+        restore_sys_modules(original_modules)
+
+    assert sys.modules["os"] is original_os
+    assert ("socket" in sys.modules) == had_socket
+
+
+def test_blocked_module_has_no_attribute_dict() -> None:
+    with pytest.raises(AttributeError):
+        object.__setattr__(BlockedModule(), "_extra", 1)
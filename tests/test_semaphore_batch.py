@@ -1,12 +1,17 @@
 """Tests for semaphore-bounded batched concurrency in LMHandler (RF-089)."""
 
 import asyncio
+import threading
 from typing import Any
 from unittest.mock import Mock
 
-from rlm.core.comms_utils import LMRequest
-from rlm.core.lm_handler import MAX_CONCURRENT_BATCH, LMRequestHandler
+import pytest
+
+from rlm.clients.vscode_lm import VsCodeLM
+from rlm.core.comms_utils import LMRequest, send_lm_request_batched
+from rlm.core.lm_handler import MAX_CONCURRENT_BATCH, LMHandler, LMRequestHandler
 from rlm.core.types import ModelUsageSummary, UsageSummary
+from tests.mock_lm import MockLM
 
 
 class TestMaxConcurrentBatchConstant:
@@ -21,6 +26,9 @@ class TestBatchedSemaphoreConcurrency:
         handler = Mock()
         handler.get_client.return_value = client
         handler.get_budget_error.return_value = None
+        handler.event_loop = None
+        handler.max_concurrent = MAX_CONCURRENT_BATCH
+        handler.collect_timing = True
         return handler
 
     def _make_mock_client(self, delay: float = 0.0) -> Mock:
@@ -107,3 +115,95 @@ class TestBatchedSemaphoreConcurrency:
 
         assert response.error is not None
         assert "Missing" in response.error
+
+    def test_batched_respects_handler_max_concurrent(self) -> None:
+        client = self._make_mock_client(delay=0.01)
+        handler = self._make_mock_handler(client)
+        handler.max_concurrent = 4
+        request_handler = LMRequestHandler.__new__(LMRequestHandler)
+
+        request = LMRequest(prompts=[f"prompt-{i}" for i in range(16)])
+        response = request_handler.handle_batched(request, handler)
+
+        assert response.error is None
+        assert 1 < client._concurrent_tracker["max"] <= 4
+
+    def test_handler_rejects_non_positive_max_concurrent(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrent"):
+            LMHandler(MockLM(), max_concurrent=0)
+
+
+class TestBatchedEventLoopReuse:
+    """Batched requests on a started handler run on its long-lived event loop."""
+
+    def test_batched_requests_share_handler_loop(self) -> None:
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        class LoopRecordingLM(MockLM):
+            async def acompletion(self, prompt: str | list[dict[str, Any]]) -> str:
+                loops.append(asyncio.get_running_loop())
+                return self.completion(prompt)
+
+        with LMHandler(LoopRecordingLM()) as handler:
+            for _ in range(2):
+                responses = send_lm_request_batched(handler.address, ["a", "b"])
+                assert all(response.success for response in responses)
+            handler_loop = handler.event_loop
+
+        assert handler_loop is not None
+        assert loops == [handler_loop] * 4
+        assert handler_loop.is_closed()
+        assert handler.event_loop is None
+
+    def test_blocking_bridge_call_does_not_delay_other_connection(self) -> None:
+        pending: dict[str, tuple[threading.Event, dict[str, Any]]] = {}
+        slow_sent = threading.Event()
+        release_slow = threading.Event()
+
+        def send_fn(payload: dict[str, Any]) -> None:
+            event, container = pending[str(payload["nonce"])]
+
+            def reply() -> None:
+                if payload["prompt"] == "slow":
+                    slow_sent.set()
+                    release_slow.wait(timeout=5)
+                container["text"] = str(payload["prompt"])
+                event.set()
+
+            threading.Thread(target=reply, daemon=True).start()
+
+        def register_response_fn(
+            nonce: str, event: threading.Event, container: dict[str, Any]
+        ) -> None:
+            pending[nonce] = (event, container)
+
+        client = VsCodeLM(send_fn=send_fn, register_response_fn=register_response_fn)
+        with LMHandler(client) as handler:
+            slow_responses: list[Any] = []
+            slow_batch = threading.Thread(
+                target=lambda: slow_responses.extend(
+                    send_lm_request_batched(handler.address, ["slow"])
+                )
+            )
+            slow_batch.start()
+            assert slow_sent.wait(timeout=5)
+
+            fast_responses = send_lm_request_batched(handler.address, ["fast"])
+            # The other connection's batch is still waiting on its bridge reply.
+            assert slow_batch.is_alive()
+
+            release_slow.set()
+            slow_batch.join(timeout=5)
+
+        for responses, text in ((fast_responses, "fast"), (slow_responses, "slow")):
+            assert [r.chat_completion.response for r in responses if r.chat_completion] == [text]
+
+
+class TestCollectTiming:
+    def test_timing_disabled_reports_zero_execution_time(self) -> None:
+        with LMHandler(MockLM(), collect_timing=False) as handler:
+            responses = send_lm_request_batched(handler.address, ["a", "b"])
+
+        completions = [response.chat_completion for response in responses]
+        assert len(completions) == 2
+        assert all(c is not None and c.execution_time == 0.0 for c in completions)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from collections import defaultdict
 from typing import Any
 
@@ -73,3 +75,61 @@ class TestTokenBudgets:
             assert response.success is False
             assert response.error is not None
             assert "Token budget exceeded for sub calls" in response.error
+
+    def test_precheck_reuses_last_within_budget_result(self) -> None:
+        root_client = BudgetMockLM("root-model")
+        handler = LMHandler(root_client, max_root_tokens=10_000)
+        counts = {"total": 0}
+        real_total = root_client.get_total_tokens
+
+        def _counting_total() -> int:
+            counts["total"] += 1
+            return real_total()
+
+        root_client.get_total_tokens = _counting_total  # type: ignore[method-assign]
+
+        handler.completion("first")
+        handler.completion("second")
+
+        # Full check around the first call, then only the post-call check.
+        assert counts["total"] == 3
+
+    def test_precheck_rejects_after_budget_exceeded(self) -> None:
+        root_client = BudgetMockLM("root-model")
+        handler = LMHandler(root_client, max_root_tokens=2)
+
+        with pytest.raises(RuntimeError, match="Token budget exceeded"):
+            handler.completion("x" * 64)
+        tokens_after_first = root_client._input_tokens["root-model"]
+
+        with pytest.raises(RuntimeError, match="Token budget exceeded"):
+            handler.completion("y" * 64)
+        assert root_client._input_tokens["root-model"] == tokens_after_first
+
+    def test_stale_within_budget_result_cannot_override_newer_check(self) -> None:
+        root_client = BudgetMockLM("root-model")
+        handler = LMHandler(root_client, max_root_tokens=10)
+        release_first = threading.Event()
+        calls = {"count": 0}
+
+        def _total_tokens() -> int:
+            calls["count"] += 1
+            if calls["count"] == 1:
+                # First checker read an old total, then stalls before recording it.
+                release_first.wait(timeout=5)
+                return 0
+            return 100
+
+        root_client.get_total_tokens = _total_tokens  # type: ignore[method-assign]
+
+        first = threading.Thread(target=handler.get_budget_error, args=(0, root_client))
+        first.start()
+        time.sleep(0.05)
+        second = threading.Thread(target=handler.get_budget_error, args=(0, root_client))
+        second.start()
+        time.sleep(0.05)
+        release_first.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+        assert handler.get_budget_error(0, root_client, precheck=True) is not None
@@ -1,8 +1,13 @@
 """Tests for rlm.utils.token_utils — model context limits and token counting."""
 
+from typing import Any
+from unittest.mock import Mock, patch
+
 from rlm.utils.token_utils import (
     CHARS_PER_TOKEN_ESTIMATE,
     DEFAULT_CONTEXT_LIMIT,
+    IncrementalTokenCounter,
+    _get_encoding,
     count_tokens,
     get_context_limit,
 )
@@ -65,3 +70,85 @@ class TestCountTokens:
     def test_returns_positive_for_non_empty(self) -> None:
         messages = [{"role": "user", "content": "x"}]
         assert count_tokens(messages, "unknown") > 0
+
+
+class TestIncrementalTokenCounter:
+    def test_matches_count_tokens_as_history_grows(self) -> None:
+        counter = IncrementalTokenCounter("unknown")
+        history: list[dict[str, Any]] = []
+        assert counter.count(history) == 0
+        for content in ("You are helpful.", "Hi there!", "x" * 17):
+            history.append({"role": "user", "content": content})
+            assert counter.count(history) == count_tokens(history, "unknown")
+
+    def test_only_new_messages_are_tokenized(self) -> None:
+        seen: list[int] = []
+
+        def _fake_tiktoken(messages: list[dict[str, Any]], _model: str) -> int:
+            seen.append(len(messages))
+            return 10 * len(messages)
+
+        counter = IncrementalTokenCounter("gpt-4o")
+        history = [{"role": "system", "content": "a"}, {"role": "user", "content": "b"}]
+        with patch("rlm.utils.token_utils._count_tokens_tiktoken", side_effect=_fake_tiktoken):
+            assert counter.count(history) == 20
+            history.append({"role": "assistant", "content": "c"})
+            assert counter.count(history) == 30
+            assert counter.count(history) == 30
+
+        assert seen == [2, 1]
+        assert counter.context_limit == 128_000
+
+    def test_restarts_for_a_replaced_history(self) -> None:
+        counter = IncrementalTokenCounter("unknown")
+        long_history = [{"role": "user", "content": "x" * 400}]
+        assert counter.count(long_history) == 100
+
+        compacted = [{"role": "user", "content": "x" * 40}]
+        assert counter.count(compacted) == 10
+
+    def test_upper_bound_covers_byte_level_worst_case(self) -> None:
+        def _one_token_per_byte(messages: list[dict[str, Any]], _model: str) -> int:
+            return sum(3 + len(str(m["content"]).encode()) for m in messages)
+
+        counter = IncrementalTokenCounter("gpt-4o")
+        history = [
+            {"role": "user", "content": "plain ascii"},
+            {"role": "assistant", "content": "héllo 世界 🚀"},
+        ]
+        with patch("rlm.utils.token_utils._count_tokens_tiktoken", side_effect=_one_token_per_byte):
+            bound = counter.upper_bound(history)
+            assert bound >= counter.count(history)
+
+    def test_upper_bound_and_estimate_do_not_tokenize(self) -> None:
+        counter = IncrementalTokenCounter("gpt-4o")
+        history = [{"role": "user", "content": "x" * 40}]
+        with patch("rlm.utils.token_utils._count_tokens_tiktoken") as tokenize:
+            assert counter.upper_bound(history) == 44
+            assert counter.estimate(history) == 10
+            tokenize.assert_not_called()
+            tokenize.return_value = 7
+            assert counter.count(history) == 7
+            tokenize.assert_called_once()
+
+
+class TestEncodingCache:
+    def test_encoding_built_once_per_model(self) -> None:
+        class _FakeEncoding:
+            def encode(self, text: str) -> list[int]:
+                return [0] * len(text.split())
+
+        fake_tiktoken = Mock()
+        fake_tiktoken.encoding_for_model.return_value = _FakeEncoding()
+        messages = [{"role": "user", "content": "one two three"}]
+
+        _get_encoding.cache_clear()
+        try:
+            with patch("rlm.utils.token_utils.importlib.import_module", return_value=fake_tiktoken):
+                first = count_tokens(messages, "gpt-4o")
+                second = count_tokens(messages, "gpt-4o")
+        finally:
+            _get_encoding.cache_clear()
+
+        assert first == second == 3 + 3
+        fake_tiktoken.encoding_for_model.assert_called_once_with("gpt-4o")